@@ -8,36 +8,35 @@ rate limiting, input validation, and security headers.
 """
 
 import re
-import uuid
+import secrets
 import time
+from functools import lru_cache
 from typing import List, Dict, Optional
 import logging
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field, field_validator
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from prometheus_fastapi_instrumentator import Instrumentator
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
-import bleach
+from selectolax.lexbor import LexborHTMLParser
 from sqlalchemy.orm import Session
 
 from micro_consent_pipeline.pipeline_runner import PipelineRunner
-from micro_consent_pipeline.config.settings import Settings
+from micro_consent_pipeline.config.settings import get_settings
 from micro_consent_pipeline.utils.logger import get_logger, setup_json_logger, generate_request_id
 from micro_consent_pipeline.utils.metrics import REGISTRY
 from micro_consent_pipeline import __version__
+from api.ratelimit import Limiter, RateLimitExceeded, get_remote_address
 from db.session import get_db, init_db
-from db.models import ConsentRecord, ClauseRecord, JobRecord
+from db.models import ConsentRecord, ClauseRecord, JobRecord, generate_job_id
 from worker.queue import enqueue_task, get_job_status, create_job_record, update_job_record
 
 # Initialize settings
-settings = Settings()
+settings = get_settings()
 
 # Setup JSON logging
 setup_json_logger("uvicorn.access", settings.log_level)
@@ -57,10 +56,6 @@ except Exception as e:
     logger = get_logger(__name__)
     logger.error(f"Failed to initialize database: {e}", extra={"version": __version__})
 
-# Add rate limiting middleware
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 # Initialize Prometheus instrumentator
 instrumentator = Instrumentator()
 instrumentator.instrument(app).expose(app, endpoint="/metrics", tags=["monitoring"])
@@ -99,6 +94,91 @@ if settings.enable_tracing:
 logger = get_logger(__name__)
 
 
+# Payload size middleware
+class PayloadSizeLimitMiddleware:
+    """
+    Limit request payload size.
+
+    Requests declaring an oversized Content-Length are rejected before the body
+    is read. Bodies without a Content-Length (chunked uploads) are counted as they
+    stream in and rejected as soon as the limit is crossed, without buffering them.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        max_bytes = settings.max_payload_bytes
+        content_length = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = int(value)
+                break
+
+        if content_length is not None:
+            if content_length > max_bytes:
+                self._log_rejection(Request(scope), content_length, max_bytes)
+                response = JSONResponse(
+                    status_code=413,
+                    content={
+                        "detail": f"Payload too large. Maximum allowed: {max_bytes} bytes"
+                    }
+                )
+                await response(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    self._log_rejection(Request(scope), received, max_bytes)
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Payload too large. Maximum allowed: {max_bytes} bytes"
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    @staticmethod
+    def _log_rejection(request: Request, content_length: int, max_bytes: int) -> None:
+        logger.warning(
+            "Request payload too large",
+            extra={
+                "client_ip": get_remote_address(request),
+                "content_length": content_length,
+                "max_allowed": max_bytes,
+                "user_agent": request.headers.get("user-agent"),
+                "request_id": generate_request_id()
+            }
+        )
+
+
+# Registered before the function middlewares below so it sits inside them and its
+# streaming 413 reaches FastAPI body parsing without being wrapped in an ExceptionGroup
+app.add_middleware(PayloadSizeLimitMiddleware)
+
+
+# Static security headers added to every response
+_SECURITY_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("Referrer-Policy", "no-referrer"),
+    ("Content-Security-Policy", "default-src 'self'"),
+    ("X-XSS-Protection", "1; mode=block"),
+)
+
+
 # Security middleware for headers
 @app.middleware("http")
 async def security_headers_middleware(request: Request, call_next):
@@ -106,50 +186,18 @@ async def security_headers_middleware(request: Request, call_next):
     response = await call_next(request)
 
     # Add security headers
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["Referrer-Policy"] = "no-referrer"
-    response.headers["Content-Security-Policy"] = "default-src 'self'"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
+    headers = response.headers
+    for name, value in _SECURITY_HEADERS:
+        headers[name] = value
 
     return response
 
 
-# Payload size middleware
-@app.middleware("http")
-async def payload_size_middleware(request: Request, call_next):
-    """Limit request payload size."""
-    content_length = request.headers.get("content-length")
-
-    if content_length:
-        content_length = int(content_length)
-        if content_length > settings.max_payload_bytes:
-            logger.warning(
-                "Request payload too large",
-                extra={
-                    "client_ip": get_remote_address(request),
-                    "content_length": content_length,
-                    "max_allowed": settings.max_payload_bytes,
-                    "user_agent": request.headers.get("user-agent"),
-                    "request_id": str(uuid.uuid4())[:8]
-                }
-            )
-            from fastapi.responses import JSONResponse
-            return JSONResponse(
-                status_code=413,
-                content={
-                    "detail": f"Payload too large. Maximum allowed: {settings.max_payload_bytes} bytes"
-                }
-            )
-
-    return await call_next(request)
-
-
 # Audit logging middleware
 @app.middleware("http")
 async def audit_middleware(request: Request, call_next):
     """Log request details for security auditing."""
-    request_id = str(uuid.uuid4())[:8]
+    request_id = generate_request_id()
     start_time = time.time()
 
     # Add request ID to request state
@@ -196,13 +244,19 @@ async def audit_middleware(request: Request, call_next):
 # CORS middleware with strict origin control
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=settings.cors_origins_set,
     allow_credentials=True,
     allow_methods=["GET", "POST"],
     allow_headers=["Content-Type", "X-API-Key", "Authorization"],
 )
 
 
+@lru_cache(maxsize=8)
+def _encode_api_key(api_key: str) -> bytes:
+    """Encode the configured API key once for constant-time comparison."""
+    return api_key.encode()
+
+
 def verify_api_key(request: Request, credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)):
     """
     Verify API key for protected endpoints.
@@ -245,7 +299,7 @@ def verify_api_key(request: Request, credentials: Optional[HTTPAuthorizationCred
             detail="API key required. Provide key in X-API-Key header or Authorization: Bearer <key>"
         )
 
-    if not settings.api_key or provided_key != settings.api_key:
+    if not settings.api_key or not secrets.compare_digest(provided_key.encode(), _encode_api_key(settings.api_key)):
         logger.warning(
             "Invalid API key",
             extra={
@@ -272,6 +326,117 @@ def verify_api_key(request: Request, credentials: Optional[HTTPAuthorizationCred
     return True
 
 
+# URL validation for localhost, IPs and valid domains, compiled once at import
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:'
+    r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?'  # domain with TLD
+    r'|'
+    r'localhost'  # localhost
+    r'|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'  # IP address
+    r')'
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)?$', re.IGNORECASE)  # optional path
+
+
+# Longer URLs are matched directly so the cache stays small
+_MAX_CACHED_URL_LENGTH = 2048
+
+
+@lru_cache(maxsize=4096)
+def _validate_url(url: str) -> bool:
+    """
+    Check a URL against the allowed URL format.
+
+    Args:
+        url: URL submitted for analysis
+
+    Returns:
+        bool: True if the URL is well formed
+    """
+    return _URL_RE.match(url) is not None
+
+
+# Allowlist matching bleach's defaults: tags, attributes per tag and URL schemes
+_ALLOWED_TAGS = frozenset({
+    'a', 'abbr', 'acronym', 'b', 'blockquote', 'code', 'em', 'i', 'li', 'ol', 'strong', 'ul'
+})
+_ALLOWED_ATTRIBUTES = {
+    'a': frozenset({'href', 'title'}),
+    'abbr': frozenset({'title'}),
+    'acronym': frozenset({'title'}),
+}
+_ALLOWED_PROTOCOLS = frozenset({'http', 'https', 'mailto'})
+# Elements whose contents are not document text; removed with their children
+_DROPPED_TAGS = [
+    'script', 'style', 'template', 'iframe', 'frame', 'frameset', 'object', 'embed',
+    'applet', 'noscript', 'noembed', 'noframes', 'svg', 'math'
+]
+# Characters browsers ignore inside a URL scheme
+_URL_NOISE_RE = re.compile(r'[\x00-\x20]+')
+_URL_SCHEME_RE = re.compile(r'([a-z][a-z0-9+.\-]*):')
+
+
+def _is_allowed_url(value: str) -> bool:
+    """
+    Check that a URL is relative or uses an allowed scheme.
+
+    Args:
+        value: Attribute value as decoded by the parser
+
+    Returns:
+        bool: True if the URL may be kept
+    """
+    match = _URL_SCHEME_RE.match(_URL_NOISE_RE.sub('', value).lower())
+    return match is None or match.group(1) in _ALLOWED_PROTOCOLS
+
+
+def _sanitize_html(source: str) -> str:
+    """
+    Reduce HTML to an allowlist of tags, attributes and URL schemes.
+
+    The allowlist is bleach's default one. Script-like elements are removed with
+    their contents, other disallowed elements are unwrapped so their text is
+    kept, and comments are dropped. The input is parsed with lexbor, which runs
+    in linear time on any input, including unclosed tags.
+
+    Args:
+        source: Raw HTML submitted for analysis
+
+    Returns:
+        str: Sanitized HTML of the document body
+    """
+    if '<' not in source:
+        return source
+
+    body = LexborHTMLParser(source).body
+    if body is None:
+        return ''
+    body.strip_tags(_DROPPED_TAGS, recursive=True)
+
+    disallowed = set()
+    comments = []
+    for node in body.traverse(include_text=True):
+        tag = node.tag
+        if tag == '-comment':
+            comments.append(node)
+        elif not tag.startswith('-') and tag != 'body' and tag not in _ALLOWED_TAGS:
+            disallowed.add(tag)
+    for node in comments:
+        node.decompose()
+    if disallowed:
+        body.unwrap_tags(list(disallowed), delete_empty=True)
+
+    for node in body.css(','.join(_ALLOWED_TAGS)):
+        allowed = _ALLOWED_ATTRIBUTES.get(node.tag, frozenset())
+        attrs = node.attrs
+        for name, value in list(attrs.items()):
+            if name not in allowed or (name == 'href' and value and not _is_allowed_url(value)):
+                del attrs[name]
+    return body.inner_html
+
+
 class AnalyzeRequest(BaseModel):
     """Request model for analyze endpoint with enhanced validation."""
     source: str = Field(..., description="URL (HTTP/HTTPS only) or raw HTML content", max_length=1048576)  # 1MB max
@@ -281,7 +446,7 @@ class AnalyzeRequest(BaseModel):
     @classmethod
     def validate_source(cls, v):
         """Validate source input for security."""
-        if not v or len(v.strip()) == 0:
+        if not v or not v.strip():
             raise ValueError("Source cannot be empty")
 
         # If it looks like a URL, validate it strictly
@@ -290,24 +455,15 @@ class AnalyzeRequest(BaseModel):
             if not v.startswith(('http://', 'https://')):
                 raise ValueError("Only HTTP and HTTPS URLs are allowed")
 
-            # More permissive URL validation for localhost and valid domains
-            url_pattern = re.compile(
-                r'^https?://'  # http:// or https://
-                r'(?:'
-                r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?'  # domain with TLD
-                r'|'
-                r'localhost'  # localhost
-                r'|'
-                r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'  # IP address
-                r')'
-                r'(?::\d+)?'  # optional port
-                r'(?:/?|[/?]\S+)?$', re.IGNORECASE)  # optional path
-
-            if not url_pattern.match(v):
+            if len(v) <= _MAX_CACHED_URL_LENGTH:
+                valid = _validate_url(v)
+            else:
+                valid = _URL_RE.match(v) is not None
+            if not valid:
                 raise ValueError("Invalid URL format")
         else:
             # For HTML content, sanitize it
-            v = bleach.clean(v, tags=bleach.ALLOWED_TAGS, attributes=bleach.ALLOWED_ATTRIBUTES)
+            v = _sanitize_html(v)
 
         return v
 
@@ -514,7 +670,7 @@ async def analyze_consent_async(
 
     try:
         # Generate job ID
-        job_id = str(uuid.uuid4())
+        job_id = generate_job_id()
 
         # Create job record in database
         create_job_record(
@@ -698,7 +854,6 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
         "retry_after": 60
     }
 
-    from fastapi.responses import JSONResponse
     return JSONResponse(status_code=429, content=response_data)
 
 
@@ -749,12 +904,13 @@ def run_analysis_with_storage(source: str, output_format: str, job_id: str) -> D
             'consent_record_id': str(consent_record_id)
         }
 
-        # Update job record with success
+        # Update job record with success. The items are already stored as clause
+        # records and in the RQ result, so the job record only keeps the summary
         update_job_record(
             job_id,
             status='finished',
             consent_record_id=str(consent_record_id),
-            result_data=response_data
+            result_data={key: value for key, value in response_data.items() if key != 'items'}
         )
 
         logger.info(f"Analysis job {job_id} completed successfully")
@@ -848,7 +1004,7 @@ def save_run_results(source: str, results: List[Dict], job_id: Optional[str] = N
 
 if __name__ == "__main__":
     import uvicorn
-    settings = Settings()
+    settings = get_settings()
 
     # Validate required security settings
     if not settings.api_key:
@@ -0,0 +1,163 @@
+# api/ratelimit.py
+# Purpose: In-process sliding-window rate limiting for the API
+
+"""
+Module: ratelimit.py
+Purpose: Per-client sliding-window rate limiting for FastAPI endpoints.
+"""
+
+import functools
+import time
+from typing import Callable, Tuple
+
+from cachetools import TTLCache
+from fastapi import Request
+
+_PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a client has exhausted its request budget."""
+
+    def __init__(self, limit: str) -> None:
+        super().__init__(f"Rate limit exceeded: {limit}")
+        self.limit = limit
+
+
+def get_remote_address(request: Request) -> str:
+    """
+    Get the client IP address for a request.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        str: Client IP address, or 127.0.0.1 if unknown
+    """
+    if not request.client or not request.client.host:
+        return "127.0.0.1"
+    return request.client.host
+
+
+def parse_limit(limit: str) -> Tuple[int, int]:
+    """
+    Parse a limit string such as "10/minute".
+
+    Args:
+        limit: Limit in "<count>/<second|minute|hour|day>" form
+
+    Returns:
+        Tuple[int, int]: Request count and period in seconds
+
+    Raises:
+        ValueError: If the limit string is malformed
+    """
+    count, _, period = limit.partition("/")
+    try:
+        return int(count), _PERIODS[period.strip().rstrip("s")]
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid rate limit: {limit!r}")
+
+
+class SlidingWindow:
+    """
+    Sliding-window counter limiting requests per client key.
+
+    Each key keeps the request counts of the current and previous fixed windows.
+    The previous count is weighted by how much of it still overlaps the sliding
+    window, which avoids the double burst a fixed window allows at its edges.
+    """
+
+    __slots__ = ("limit", "window", "data")
+
+    def __init__(self, limit: int, window: float, maxsize: int = 100_000) -> None:
+        """
+        Initialize the window.
+
+        Args:
+            limit: Maximum requests per window
+            window: Window length in seconds
+            maxsize: Maximum number of tracked client keys
+        """
+        self.limit = limit
+        self.window = window
+        # A key idle for two windows has no counts left that matter
+        self.data: TTLCache = TTLCache(maxsize=maxsize, ttl=2 * window)
+
+    def hit(self, key: str, now: float) -> bool:
+        """
+        Record a request for a key if it is within the limit.
+
+        Args:
+            key: Client key
+            now: Current monotonic time
+
+        Returns:
+            bool: True if the request is allowed
+        """
+        win_start = now // self.window * self.window
+        prev_count, curr_count, curr_win = self.data.get(key, (0, 0, win_start))
+        if curr_win != win_start:
+            # Roll over; counts older than the previous window no longer overlap
+            prev_count = curr_count if win_start - curr_win == self.window else 0
+            curr_count = 0
+
+        fraction = (now - win_start) / self.window
+        allowed = prev_count * (1 - fraction) + curr_count < self.limit
+        if allowed:
+            curr_count += 1
+        self.data[key] = (prev_count, curr_count, win_start)
+        return allowed
+
+
+class Limiter:
+    """
+    Per-route, per-client sliding-window rate limiter.
+
+    Endpoints are limited with the ``limit`` decorator, which checks the window
+    after FastAPI has resolved authentication and request validation, so rejected
+    requests do not consume the client's budget.
+    """
+
+    def __init__(self, key_func: Callable[[Request], str] = get_remote_address, maxsize: int = 100_000) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            key_func: Function mapping a request to a client key
+            maxsize: Maximum number of tracked clients per route
+        """
+        self.key_func = key_func
+        self.maxsize = maxsize
+
+    def limit(self, limit: str) -> Callable:
+        """
+        Decorate an endpoint with a rate limit.
+
+        Args:
+            limit: Limit string such as "10/minute"
+
+        Returns:
+            Callable: Decorator for an async endpoint taking a ``request`` argument
+        """
+        count, period = parse_limit(limit)
+        window = SlidingWindow(count, period, self.maxsize)
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                request = kwargs.get("request")
+                if request is None:
+                    request = next(arg for arg in args if isinstance(arg, Request))
+                if not window.hit(self.key_func(request), time.monotonic()):
+                    raise RateLimitExceeded(limit)
+                return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
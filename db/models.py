@@ -5,6 +5,8 @@
 Database models for storing consent analysis results.
 """
 
+import os
+import time
 import uuid
 from datetime import datetime
 from typing import Optional
@@ -17,6 +19,36 @@ from sqlalchemy.sql import func
 Base = declarative_base()
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7).
+
+    The leading 48 bits hold the Unix time in milliseconds, so IDs created in
+    sequence sort together and insert near the end of the primary key index.
+
+    Returns:
+        uuid.UUID: Version 7 UUID
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80   # unix_ts_ms
+    value |= 0x7 << 76                            # version
+    value |= (rand >> 62 & 0xFFF) << 64           # rand_a
+    value |= 0b10 << 62                           # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF         # rand_b
+    return uuid.UUID(int=value)
+
+
+def generate_job_id() -> str:
+    """
+    Generate a job ID for RQ jobs and their JobRecord rows.
+
+    Returns:
+        str: Time-ordered UUID as 32 hex digits, without dashes
+    """
+    return uuid7().hex
+
+
 class ConsentRecord(Base):
     """
     Main record for a consent analysis run.
@@ -89,7 +121,7 @@ class JobRecord(Base):
     """
     __tablename__ = "job_records"
 
-    id = Column(String(36), primary_key=True)  # RQ job ID
+    id = Column(String(36), primary_key=True, default=generate_job_id)  # RQ job ID
     consent_record_id = Column(UUID(as_uuid=True), ForeignKey("consent_records.id"), nullable=True, index=True)
 
     # Job metadata
@@ -11,11 +11,11 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
-from micro_consent_pipeline.config.settings import Settings
+from micro_consent_pipeline.config.settings import get_settings
 from db.models import Base
 
 # Initialize settings
-settings = Settings()
+settings = get_settings()
 
 # Create engine with appropriate configuration
 if settings.database_url.startswith('sqlite'):
@@ -24,7 +24,7 @@ if settings.database_url.startswith('sqlite'):
         settings.database_url,
         echo=settings.database_echo,
         connect_args={"check_same_thread": False},  # Allow SQLite to be used with multiple threads
-        poolclass=StaticPool,  # Use static pool for SQLite
+        poolclass=StaticPool,  # One shared connection, so in-memory databases are seen by every session
     )
 else:
     # PostgreSQL and other databases
@@ -33,6 +33,8 @@ else:
         echo=settings.database_echo,
         pool_pre_ping=True,  # Verify connections before use
         pool_recycle=300,    # Recycle connections after 5 minutes
+        pool_size=settings.database_pool_size,        # Match the process's concurrency
+        max_overflow=settings.database_max_overflow,  # 0 caps connections at pool_size
     )
 
 # Create session factory
@@ -53,6 +55,17 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _is_memory_database() -> bool:
+    """
+    Check whether the engine points at an in-memory SQLite database.
+
+    Returns:
+        bool: True for ``:memory:`` and ``mode=memory`` URI databases
+    """
+    database = engine.url.database
+    return not database or database == ':memory:' or engine.url.query.get('mode') == 'memory'
+
+
 def init_db() -> None:
     """
     Initialize the database by creating all tables.
@@ -60,10 +73,11 @@ def init_db() -> None:
     This creates all tables defined in the models if they don't exist.
     For production, consider using Alembic migrations instead.
     """
-    # Ensure the data directory exists for SQLite
-    if settings.database_url.startswith('sqlite'):
-        db_path = settings.database_url.replace('sqlite:///', '')
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    # Ensure the data directory exists for file-backed SQLite
+    if settings.database_url.startswith('sqlite') and not _is_memory_database():
+        db_dir = os.path.dirname(engine.url.database)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
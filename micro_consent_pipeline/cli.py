@@ -9,6 +9,7 @@ managing workers, and performing administrative tasks.
 
 import argparse
 import sys
+from typing import List, Optional
 from pathlib import Path
 
 # Add project root to path for imports
@@ -248,10 +249,15 @@ def cmd_info(args):
     return 0
 
 
-def main():
-    """Main CLI entry point."""
+def main(argv: Optional[List[str]] = None):
+    """
+    Main CLI entry point.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Configure logging
     if args.verbose:
@@ -6,6 +6,7 @@ Settings module for loading configuration from environment variables.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -48,16 +49,31 @@ class Settings:
         self.max_payload_bytes: int = int(os.getenv('MAX_PAYLOAD_BYTES', '10485760'))  # 10MB default
         self.request_timeout: int = int(os.getenv('REQUEST_TIMEOUT', '30'))  # Override existing with security focus
         self.cors_origins: list = [origin.strip() for origin in self.allowed_origins.split(',') if origin.strip()]
+        self.cors_origins_set: frozenset = frozenset(self.cors_origins)  # O(1) origin checks in CORS middleware
 
         # Database settings
         self.database_url: str = os.getenv('DATABASE_URL', 'sqlite:///data/micro_consent.db')
         self.database_echo: bool = os.getenv('DATABASE_ECHO', 'false').lower() == 'true'
+        self.database_pool_size: int = int(os.getenv('DATABASE_POOL_SIZE', '5'))  # Persistent connections per process
+        self.database_max_overflow: int = int(os.getenv('DATABASE_MAX_OVERFLOW', '10'))  # Extra connections under bursts
 
         # Async job queue settings
         self.redis_url: str = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        self.redis_max_connections: int = int(os.getenv('REDIS_MAX_CONNECTIONS', '50'))  # Size to at least the number of concurrent callers
         self.job_timeout: int = int(os.getenv('JOB_TIMEOUT', '300'))  # 5 minutes default
         self.result_ttl: int = int(os.getenv('RESULT_TTL', '3600'))  # 1 hour default
 
         # Dynamic rendering settings
         self.enable_js_render: bool = os.getenv('ENABLE_JS_RENDER', 'false').lower() == 'true'
-        self.js_render_timeout: int = int(os.getenv('JS_RENDER_TIMEOUT', '30'))
\ No newline at end of file
+        self.js_render_timeout: int = int(os.getenv('JS_RENDER_TIMEOUT', '30'))
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the shared application settings instance.
+
+    Returns:
+        Settings: Settings built once from the environment and reused afterwards.
+    """
+    return Settings()
@@ -11,12 +11,37 @@ import os
 from typing import List, Dict, Union
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from playwright.sync_api import sync_playwright
 
 from micro_consent_pipeline.config.settings import Settings
 from micro_consent_pipeline.utils.logger import get_logger
 
+# Prefer orjson's C parser for JSON sources when it is installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+BUTTON_KEYWORDS = ('accept', 'reject', 'consent', 'agree', 'decline', 'manage', 'preferences')
+LINK_KEYWORDS = ('privacy', 'cookie', 'consent', 'policy', 'preferences')
+BANNER_KEYWORDS = ('cookie', 'consent', 'gdpr')
+
+
+def _is_banner_class(value: str) -> bool:
+    """
+    Check whether a class attribute marks a cookie banner.
+
+    Args:
+        value: Space-separated class attribute value
+
+    Returns:
+        bool: True if any class token contains a banner keyword
+    """
+    return any(word in token for token in value.lower().split() for word in BANNER_KEYWORDS)
+
 
 class ConsentExtractor:
     """
@@ -58,7 +83,7 @@ class ConsentExtractor:
             else:
                 content = self._fetch_static_html(source)
             try:
-                return json.loads(content)
+                return _json_loads(content)
             except json.JSONDecodeError:
                 return content
         elif os.path.isfile(source):
@@ -66,13 +91,13 @@ class ConsentExtractor:
             with open(source, 'r', encoding='utf-8') as f:
                 content = f.read()
             try:
-                return json.loads(content)
+                return _json_loads(content)
             except json.JSONDecodeError:
                 return content
         else:
             self.logger.debug("Treating as raw content")
             try:
-                return json.loads(source)
+                return _json_loads(source)
             except json.JSONDecodeError:
                 return source
 
@@ -123,27 +148,57 @@ class ConsentExtractor:
             List[Dict[str, str]]: List of extracted elements.
         """
         self.logger.info("Starting HTML extraction")
-        soup = BeautifulSoup(html_content, 'html.parser')
+        tree = LexborHTMLParser(html_content)
+        # Script and style contents are not visible text
+        tree.strip_tags(['script', 'style'])
         elements: List[Dict[str, str]] = []
 
+        # Single document-order pass; each checkbox takes the text of the next label
+        checkbox_labels: List[List[str]] = []
+        pending_checkboxes: List[List[str]] = []
+        buttons = []
+        inputs = []
+        links = []
+        banners = []
+        for node in tree.root.traverse():
+            tag = node.tag
+            if tag == 'input':
+                input_type = node.attributes.get('type')
+                if input_type == 'checkbox':
+                    slot = ['']
+                    checkbox_labels.append(slot)
+                    pending_checkboxes.append(slot)
+                elif input_type in ('submit', 'button'):
+                    inputs.append(node)
+            elif tag == 'label':
+                if pending_checkboxes:
+                    label_text = node.text(separator='', strip=True)
+                    for slot in pending_checkboxes:
+                        slot[0] = label_text
+                    pending_checkboxes.clear()
+            elif tag == 'button':
+                buttons.append(node)
+            elif tag == 'a':
+                links.append(node)
+            elif tag in ('div', 'section'):
+                classes = node.attributes.get('class')
+                if classes and _is_banner_class(classes):
+                    banners.append(node)
+
         # Extract checkboxes with labels
-        for checkbox in soup.find_all('input', {'type': 'checkbox'}):
-            label = checkbox.find_next('label')
-            if label:
-                text = label.get_text(strip=True)
-                if text:
-                    elements.append({
-                        "type": "checkbox",
-                        "text": text,
-                        "element": "input"
-                    })
+        for slot in checkbox_labels:
+            text = slot[0]
+            if text:
+                elements.append({
+                    "type": "checkbox",
+                    "text": text,
+                    "element": "input"
+                })
 
         # Extract buttons
-        buttons = soup.find_all('button')
-        inputs = soup.find_all('input', {'type': ['submit', 'button']})
         for button in buttons + inputs:
-            text = button.get('value') or button.get_text(strip=True)
-            if text and any(word in text.lower() for word in ['accept', 'reject', 'consent', 'agree', 'decline', 'manage', 'preferences']):
+            text = button.attributes.get('value') or button.text(separator='', strip=True)
+            if text and any(word in text.lower() for word in BUTTON_KEYWORDS):
                 elements.append({
                     "type": "button",
                     "text": text,
@@ -151,9 +206,9 @@ class ConsentExtractor:
                 })
 
         # Extract links related to privacy/consent
-        for link in soup.find_all('a'):
-            text = link.get_text(strip=True)
-            if text and any(word in text.lower() for word in ['privacy', 'cookie', 'consent', 'policy', 'preferences']):
+        for link in links:
+            text = link.text(separator='', strip=True)
+            if text and any(word in text.lower() for word in LINK_KEYWORDS):
                 elements.append({
                     "type": "link",
                     "text": text,
@@ -161,8 +216,8 @@ class ConsentExtractor:
                 })
 
         # Extract cookie banner text
-        for div in soup.find_all(['div', 'section'], class_=lambda c: c and any(word in ' '.join(c).lower() for word in ['cookie', 'consent', 'gdpr'])):
-            text = div.get_text(strip=True)
+        for div in banners:
+            text = div.text(separator='', strip=True)
             if text and len(text) > 10:  # Avoid too short texts
                 elements.append({
                     "type": "banner",
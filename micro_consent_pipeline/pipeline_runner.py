@@ -183,23 +183,25 @@ class PipelineRunner:
 
                 db.add(consent_record)
                 db.flush()  # Get the ID
-
-                # Create ClauseRecords
-                for result in results:
-                    clause_record = ClauseRecord(
-                        consent_id=consent_record.id,
-                        text=result.get('text', ''),
-                        category=result.get('category', 'unknown'),
-                        confidence=result.get('confidence'),
-                        element_type=result.get('element', 'unknown'),
-                        is_interactive=str(result.get('type', '')).lower()
-                    )
-                    db.add(clause_record)
+                consent_id = consent_record.id
+
+                # Create ClauseRecords with one executemany INSERT
+                db.bulk_insert_mappings(ClauseRecord, [
+                    {
+                        'consent_id': consent_id,
+                        'text': result.get('text', ''),
+                        'category': result.get('category', 'unknown'),
+                        'confidence': result.get('confidence'),
+                        'element_type': result.get('element', 'unknown'),
+                        'is_interactive': str(result.get('type', '')).lower()
+                    }
+                    for result in results
+                ])
 
                 db.commit()
 
-                self.logger.info(f"Saved analysis results to database: {consent_record.id}")
-                return str(consent_record.id)
+                self.logger.info(f"Saved analysis results to database: {consent_id}")
+                return str(consent_id)
 
             except Exception as e:
                 db.rollback()
@@ -6,6 +6,7 @@ Module: nlp_processor.py
 Purpose: Classify extracted consent elements into semantic categories using NLP and heuristics.
 """
 
+import re
 import time
 from typing import List, Dict, Any
 
@@ -21,23 +22,22 @@ class ClauseClassifier:
     Class for classifying consent clauses into categories using NLP and heuristics.
     """
 
-    def __init__(self, model_name: str = "en_core_web_sm", settings: Settings = None) -> None:
+    def __init__(self, model_name: str = "en_core_web_sm", settings: Settings = None, lightweight: bool = False) -> None:
         """
         Initialize the ClauseClassifier with a spaCy model.
 
+        The spaCy model is loaded lazily on first access to ``nlp``.
+
         Args:
             model_name (str): Name of the spaCy model to load.
             settings (Settings): Application settings.
+            lightweight (bool): Use a blank English pipeline (tokenizer only) instead of loading model_name.
         """
         self.settings = settings or Settings()
         self.logger = get_logger(__name__)
-        try:
-            self.nlp = spacy.load(model_name)
-            self.logger.info("Loaded spaCy model: %s", model_name)
-        except OSError:
-            self.logger.warning("spaCy model %s not found, downloading...", model_name)
-            spacy.cli.download(model_name)
-            self.nlp = spacy.load(model_name)
+        self.model_name = model_name
+        self.lightweight = lightweight
+        self._nlp = None
 
         # Keyword mappings for rule-based classification
         self.keyword_categories = {
@@ -61,6 +61,29 @@ class ClauseClassifier:
             'privacy': 'Privacy',
             'policy': 'Privacy',
         }
+        # Any-keyword prefilter so texts without keywords are rejected in one scan
+        self._keyword_pattern = re.compile('|'.join(re.escape(keyword) for keyword in self.keyword_categories))
+
+    @property
+    def nlp(self) -> spacy.language.Language:
+        """
+        spaCy pipeline, loaded on first access.
+
+        Returns:
+            spacy.language.Language: Loaded spaCy pipeline.
+        """
+        if self._nlp is None and self.lightweight:
+            self._nlp = spacy.blank("en")
+            self.logger.info("Using blank spaCy pipeline")
+        elif self._nlp is None:
+            try:
+                self._nlp = spacy.load(self.model_name)
+                self.logger.info("Loaded spaCy model: %s", self.model_name)
+            except OSError:
+                self.logger.warning("spaCy model %s not found, downloading...", self.model_name)
+                spacy.cli.download(self.model_name)
+                self._nlp = spacy.load(self.model_name)
+        return self._nlp
 
     def classify_clauses(self, consent_items: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """
@@ -129,6 +152,10 @@ class ClauseClassifier:
             tuple[str, float]: Category and confidence score.
         """
         text_lower = text.lower()
+        if not self._keyword_pattern.search(text_lower):
+            return 'Other', 0.5
+
+        # Keyword order sets priority when several keywords are present
         for keyword, category in self.keyword_categories.items():
             if keyword in text_lower:
                 return category, 0.8  # High confidence for keyword match
@@ -0,0 +1,37 @@
+# micro_consent_pipeline/tests/conftest.py
+# Purpose: Shared pytest fixtures
+
+"""
+Shared fixtures for the test suite.
+"""
+
+import os
+from unittest.mock import Mock
+
+# Run the suite against a shared in-memory database; set before db.session builds its engine
+os.environ.setdefault('DATABASE_URL', 'sqlite:///file:testdb?mode=memory&cache=shared&uri=true')
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    TestClient for the API, started once per test session.
+    """
+    from api.app import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def mock_runner(monkeypatch):
+    """
+    Replace the API's PipelineRunner with a mock returning no results.
+    """
+    runner = Mock()
+    runner.return_value.run.return_value = []
+    monkeypatch.setattr('api.app.PipelineRunner', runner)
+    return runner
@@ -6,12 +6,69 @@ Test dynamic HTML extraction functionality.
 """
 
 import pytest
+from dataclasses import dataclass
+from typing import Optional
 from unittest.mock import patch, MagicMock
 
 from micro_consent_pipeline.config.settings import Settings
 from micro_consent_pipeline.ingestion.extractor import ConsentExtractor
 
 
+@dataclass
+class StubPage:
+    """Minimal stand-in for a Playwright page."""
+    html: str
+    url: Optional[str] = None
+    timeout: Optional[int] = None
+
+    def goto(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+
+    def wait_for_timeout(self, timeout):
+        pass
+
+    def content(self):
+        return self.html
+
+
+@dataclass
+class StubBrowser:
+    """Minimal stand-in for a Playwright browser."""
+    page: StubPage
+    closed: bool = False
+
+    def new_page(self):
+        return self.page
+
+    def close(self):
+        self.closed = True
+
+
+@dataclass
+class StubChromium:
+    """Minimal stand-in for the Playwright chromium browser type."""
+    browser: StubBrowser
+
+    def launch(self):
+        return self.browser
+
+
+@dataclass
+class StubPlaywright:
+    """Minimal stand-in for the sync_playwright() context manager."""
+    chromium: StubChromium
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
 class TestDynamicExtraction:
     """Test cases for dynamic HTML extraction."""
 
@@ -50,25 +107,20 @@ class TestDynamicExtraction:
         assert result == '<html><body>Test content</body></html>'
         mock_get.assert_called_once_with('http://example.com', timeout=self.settings.request_timeout)
 
-    @patch('micro_consent_pipeline.ingestion.extractor.sync_playwright')
-    def test_fetch_dynamic_html(self, mock_sync_playwright):
+    def test_fetch_dynamic_html(self):
         """Test dynamic HTML fetching with Playwright."""
-        # Mock the Playwright context
-        mock_browser = MagicMock()
-        mock_page = MagicMock()
-        mock_page.content.return_value = '<html><body>Dynamic content</body></html>'
-        mock_browser.new_page.return_value = mock_page
-        mock_browser.close.return_value = None
+        stub_page = StubPage('<html><body>Dynamic content</body></html>')
+        stub_browser = StubBrowser(stub_page)
+        stub_playwright = StubPlaywright(StubChromium(stub_browser))
 
-        mock_playwright = MagicMock()
-        mock_playwright.chromium.launch.return_value = mock_browser
-        mock_sync_playwright.return_value.__enter__.return_value = mock_playwright
-
-        extractor = ConsentExtractor(self.settings)
-        result = extractor._fetch_dynamic_html('http://example.com')
+        with patch('micro_consent_pipeline.ingestion.extractor.sync_playwright', stub_playwright):
+            extractor = ConsentExtractor(self.settings)
+            result = extractor._fetch_dynamic_html('http://example.com')
 
         assert result == '<html><body>Dynamic content</body></html>'
-        mock_page.goto.assert_called_once_with('http://example.com', timeout=30000)  # 30 seconds in ms
+        assert stub_page.url == 'http://example.com'
+        assert stub_page.timeout == 30000  # 30 seconds in ms
+        assert stub_browser.closed is True
 
     @patch('micro_consent_pipeline.ingestion.extractor.sync_playwright')
     def test_dynamic_rendering_fallback_on_failure(self, mock_sync_playwright):
@@ -5,9 +5,12 @@
 Tests for the ingestion module.
 """
 
+import json
+import time
+
 import pytest
 from micro_consent_pipeline.config.settings import Settings
-from micro_consent_pipeline.ingestion.extractor import ConsentExtractor
+from micro_consent_pipeline.ingestion.extractor import ConsentExtractor, _is_banner_class
 
 
 def test_consent_extractor_initialization():
@@ -37,10 +40,40 @@ def test_from_html():
     </html>
     """
     result = extractor.from_html(html_content)
-    assert len(result) == 4  # checkbox, 2 buttons, link (banner not detected due to class parsing)
+    assert len(result) == 5  # checkbox, 2 buttons, link, banner
     assert any(elem['type'] == 'checkbox' for elem in result)
     assert any('Accept All' in elem['text'] for elem in result)
     assert any('Privacy Policy' in elem['text'] for elem in result)
+    assert any(elem['type'] == 'banner' and 'uses cookies' in elem['text'] for elem in result)
+
+
+@pytest.mark.parametrize("classes, expected", [
+    ("cookie-banner", True),
+    ("modal GDPR-notice", True),
+    ("wrapper consent", True),
+    ("header nav", False),
+    ("", False),
+])
+def test_is_banner_class(classes, expected):
+    """
+    Test banner detection on each token of a class attribute.
+    """
+    assert _is_banner_class(classes) is expected
+
+
+@pytest.mark.slow
+def test_from_html_large():
+    """
+    Test extraction from a large HTML document stays fast.
+    """
+    settings = Settings()
+    extractor = ConsentExtractor(settings)
+    html_content = "<html><body>" + "<button>Accept</button>" * 100_000 + "</body></html>"
+    start_time = time.perf_counter()
+    result = extractor.from_html(html_content)
+    elapsed = time.perf_counter() - start_time
+    assert len(result) == 100_000
+    assert elapsed < 2.0
 
 
 def test_from_json():
@@ -73,6 +106,35 @@ def test_load_source_raw_string():
     assert result['key'] == 'value'
 
 
+@pytest.mark.parametrize("n", [1, 1000, 100000])
+def test_load_source_large_json(n):
+    """
+    Test that large raw JSON payloads are parsed completely.
+    """
+    settings = Settings()
+    extractor = ConsentExtractor(settings)
+    items = [{"i": i, "text": f"clause {i}"} for i in range(n)]
+    result = extractor.load_source(json.dumps({"items": items}))
+    assert isinstance(result, dict)
+    assert len(result['items']) == n
+    assert result['items'] == items
+
+
+@pytest.mark.slow
+def test_load_source_large_json_timing():
+    """
+    Test that a large raw JSON payload is parsed quickly.
+    """
+    settings = Settings()
+    extractor = ConsentExtractor(settings)
+    n = 100000
+    payload = json.dumps({"items": [{"i": i} for i in range(n)]})
+    start_time = time.perf_counter()
+    extractor.load_source(payload)
+    elapsed = time.perf_counter() - start_time
+    assert elapsed < 0.1 + n * 1e-6
+
+
 def test_load_source_raw_html():
     """
     Test loading from raw HTML string.
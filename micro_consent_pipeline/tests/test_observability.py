@@ -1,5 +1,7 @@
+import time
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 from micro_consent_pipeline.utils.metrics import MetricsCollector
 from micro_consent_pipeline.utils.logger import setup_json_logger, get_logger, generate_request_id
 
@@ -61,6 +63,43 @@ class TestObservability:
             assert mock_classifications.labels.call_count == 2
             assert mock_classifications_with_labels.inc.call_count == 2
 
+    def test_pipeline_success_recording_batches_classifications(self):
+        """Test classification counts are emitted once per category, not per item."""
+        collector = MetricsCollector()
+
+        with patch('micro_consent_pipeline.utils.metrics.pipeline_runs_total'), \
+             patch('micro_consent_pipeline.utils.metrics.pipeline_run_seconds'), \
+             patch('micro_consent_pipeline.utils.metrics.items_processed_total') as mock_items, \
+             patch('micro_consent_pipeline.utils.metrics.classifications_total') as mock_classifications, \
+             patch('micro_consent_pipeline.utils.metrics.pipeline_runs_in_progress'):
+
+            mock_classifications_with_labels = Mock()
+            mock_classifications.labels.return_value = mock_classifications_with_labels
+
+            categories = {"data_collection": 5000, "cookie_usage": 5000}
+            collector.record_pipeline_success(1.0, 10_000, categories)
+
+            mock_items.inc.assert_called_once_with(10_000)
+            assert mock_classifications.labels.call_count == len(categories)
+            assert mock_classifications_with_labels.inc.call_args_list == [call(5000), call(5000)]
+
+    def test_metric_label_children_are_cached(self):
+        """Test that label children are bound once and reused across runs."""
+        collector = MetricsCollector()
+
+        with patch('micro_consent_pipeline.utils.metrics.pipeline_runs_total') as mock_counter, \
+             patch('micro_consent_pipeline.utils.metrics.pipeline_run_seconds'), \
+             patch('micro_consent_pipeline.utils.metrics.items_processed_total'), \
+             patch('micro_consent_pipeline.utils.metrics.classifications_total') as mock_classifications, \
+             patch('micro_consent_pipeline.utils.metrics.pipeline_runs_in_progress'):
+
+            for _ in range(3):
+                collector.record_pipeline_success(1.0, 2, {"data_collection": 1, "cookie_usage": 1})
+
+            mock_counter.labels.assert_called_once_with(status='success')
+            assert mock_classifications.labels.call_count == 2
+            assert mock_counter.labels.return_value.inc.call_count == 3
+
     def test_pipeline_failure_recording(self):
         """Test pipeline failure recording updates error metrics."""
         collector = MetricsCollector()
@@ -101,6 +140,18 @@ class TestObservability:
         assert logger.name == 'test_module'
         assert logger.level == 20  # INFO level
 
+    def test_json_logger_setup_idempotent(self):
+        """Test that repeated JSON logger setup does not duplicate handlers."""
+        import logging
+
+        logger_1 = setup_json_logger('test_idempotent', 'INFO')
+        logger_2 = setup_json_logger('test_idempotent', 'DEBUG')
+
+        assert logger_1 is logger_2
+        stream_handlers = [h for h in logger_1.handlers if isinstance(h, logging.StreamHandler)]
+        assert len(stream_handlers) == 1
+        assert logger_2.level == logging.DEBUG
+
     def test_get_logger_function(self):
         """Test get_logger function."""
         logger = get_logger('test_module')
@@ -121,6 +172,17 @@ class TestObservability:
         assert isinstance(req_id_1, str)
         assert isinstance(req_id_2, str)
 
+    @pytest.mark.slow
+    def test_request_id_generation_throughput(self):
+        """Test that request ID generation stays cheap on the hot path."""
+        n = 100_000
+        start_time = time.perf_counter()
+        for _ in range(n):
+            generate_request_id()
+        elapsed = time.perf_counter() - start_time
+
+        assert elapsed < 1.0
+
     def test_structured_logging_with_extra_data(self):
         """Test structured logging with extra data."""
         logger = get_logger('test_module')
@@ -198,6 +260,25 @@ class TestObservability:
         assert "INFO" in log_output
         assert "Test JSON logging" in log_output
 
+    def test_json_formatter_serializes_extra_fields(self):
+        """Test that the configured JSON formatter emits parseable records with extra fields."""
+        import json
+        import logging
+        from datetime import datetime
+
+        logger = setup_json_logger('test_json_formatter', 'INFO')
+        formatter = logger.handlers[0].formatter
+        record = logging.LogRecord('test_json_formatter', logging.INFO, __file__, 1, "Processed %d clauses", (3,), None)
+        record.categories = ["analytics", "marketing"]
+        record.started_at = datetime(2024, 1, 1)
+
+        data = json.loads(formatter.format(record))
+
+        assert data["message"] == "Processed 3 clauses"
+        assert data["levelname"] == "INFO"
+        assert data["categories"] == ["analytics", "marketing"]
+        assert data["started_at"].startswith("2024-01-01")
+
     def test_logger_utilities_available(self):
         """Test that logger utility functions are available."""
         # Test that we can import the logger utilities
@@ -2,23 +2,22 @@ import pytest
 import asyncio
 import json
 from unittest.mock import Mock, patch
-from fastapi.testclient import TestClient
 from fastapi import HTTPException
 import time
 import uuid
 import os
 
-from api.app import app, verify_api_key
+from api.app import app, verify_api_key, _sanitize_html, _validate_url
+from api.ratelimit import Limiter, RateLimitExceeded, SlidingWindow, parse_limit
 from micro_consent_pipeline.config.settings import Settings
 
-# Create test client
-client = TestClient(app)
 
 class TestSecurity:
     """Test suite for security features."""
 
-    def setup_method(self):
-        """Set up test environment with mock settings."""
+    @pytest.fixture(autouse=True)
+    def setup_settings(self, monkeypatch, mock_runner):
+        """Set up test environment with mock settings and a mocked PipelineRunner."""
         self.mock_settings = Mock(spec=Settings)
         self.mock_settings.api_key = "test-api-key-12345"
         self.mock_settings.cors_origins = ["http://localhost:3000", "http://localhost:8501"]
@@ -26,15 +25,9 @@ class TestSecurity:
         self.mock_settings.request_timeout = 30
 
         # Patch settings in the app module
-        patcher = patch('api.app.settings', self.mock_settings)
-        patcher.start()
-        self.addCleanup(patcher.stop)
+        monkeypatch.setattr('api.app.settings', self.mock_settings)
 
-    def addCleanup(self, func):
-        """Helper to add cleanup functions (pytest compatibility)."""
-        pass
-
-    def test_health_endpoint_open_access(self):
+    def test_health_endpoint_open_access(self, client):
         """Test that health endpoint doesn't require authentication."""
         response = client.get("/health")
         assert response.status_code == 200
@@ -44,7 +37,7 @@ class TestSecurity:
         assert "timestamp" in data
         assert "version" in data
 
-    def test_analyze_endpoint_requires_api_key(self):
+    def test_analyze_endpoint_requires_api_key(self, client):
         """Test that analyze endpoint requires API key."""
         # Test without API key
         response = client.post("/analyze", json={
@@ -54,7 +47,7 @@ class TestSecurity:
         assert response.status_code == 401
         assert "API key required" in response.json()["detail"]
 
-    def test_analyze_endpoint_invalid_api_key(self):
+    def test_analyze_endpoint_invalid_api_key(self, client):
         """Test that analyze endpoint rejects invalid API key."""
         # Test with invalid API key in header
         response = client.post(
@@ -74,12 +67,10 @@ class TestSecurity:
         assert response.status_code == 401
         assert "Invalid API key" in response.json()["detail"]
 
-    @patch('api.app.PipelineRunner')
-    def test_analyze_endpoint_valid_api_key(self, mock_runner):
+    def test_analyze_endpoint_valid_api_key(self, client, mock_runner):
         """Test that analyze endpoint accepts valid API key."""
         # Mock successful pipeline run
-        mock_instance = Mock()
-        mock_instance.run.return_value = [
+        mock_runner.return_value.run.return_value = [
             {
                 "text": "We collect your data",
                 "category": "data_collection",
@@ -88,7 +79,6 @@ class TestSecurity:
                 "element": "p"
             }
         ]
-        mock_runner.return_value = mock_instance
 
         # Test with valid API key in X-API-Key header
         response = client.post(
@@ -111,7 +101,7 @@ class TestSecurity:
         )
         assert response.status_code == 200
 
-    def test_rate_limiting_health_endpoint(self):
+    def test_rate_limiting_health_endpoint(self, client):
         """Test rate limiting on health endpoint."""
         # This test would require modifying the rate limiter for testing
         # In a real scenario, you'd use a test-specific rate limiter
@@ -123,14 +113,8 @@ class TestSecurity:
         # All should succeed for health endpoint (60/min limit)
         assert all(status == 200 for status in responses)
 
-    @patch('api.app.PipelineRunner')
-    def test_rate_limiting_analyze_endpoint(self, mock_runner):
+    def test_rate_limiting_analyze_endpoint(self, client):
         """Test rate limiting on analyze endpoint."""
-        # Mock successful pipeline run
-        mock_instance = Mock()
-        mock_instance.run.return_value = []
-        mock_runner.return_value = mock_instance
-
         # Make several requests quickly
         responses = []
         headers = {"X-API-Key": "test-api-key-12345"}
@@ -147,7 +131,7 @@ class TestSecurity:
         # Note: In real testing, you'd need to mock the rate limiter or use time manipulation
         assert any(status in [200, 429] for status in responses)
 
-    def test_payload_size_limit(self):
+    def test_payload_size_limit(self, client):
         """Test that oversized payloads are rejected."""
         # Create a large payload that exceeds the 1KB test limit
         large_source = "x" * 2048  # 2KB
@@ -162,7 +146,23 @@ class TestSecurity:
         assert response.status_code == 413
         assert "Payload too large" in response.json()["detail"]
 
-    def test_url_validation_https_only(self):
+    def test_payload_size_limit_chunked(self, client):
+        """Test that oversized chunked payloads without Content-Length are rejected."""
+        def body():
+            yield b'{"source": "'
+            yield b"x" * 2048
+            yield b'", "output_format": "json"}'
+
+        response = client.post(
+            "/analyze",
+            content=body(),
+            headers={"X-API-Key": "test-api-key-12345", "Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 413
+        assert "Payload too large" in response.json()["detail"]
+
+    def test_url_validation_https_only(self, client):
         """Test that only HTTP/HTTPS URLs are allowed."""
         headers = {"X-API-Key": "test-api-key-12345"}
 
@@ -182,7 +182,16 @@ class TestSecurity:
             )
             assert response.status_code == 422  # Pydantic validation error
 
-    def test_url_validation_valid_urls(self):
+    def test_url_validation_is_cached(self):
+        """Test that repeated URL validations are served from the cache."""
+        _validate_url.cache_clear()
+
+        assert _validate_url("https://example.com/privacy") is True
+        assert _validate_url("https://example.com/privacy") is True
+        assert _validate_url("https://exa mple.com") is False
+        assert _validate_url.cache_info().hits == 1
+
+    def test_url_validation_valid_urls(self, client):
         """Test that valid HTTP/HTTPS URLs are accepted."""
         headers = {"X-API-Key": "test-api-key-12345"}
 
@@ -192,21 +201,16 @@ class TestSecurity:
             "https://subdomain.example.com:443/path?query=value"
         ]
 
-        with patch('api.app.PipelineRunner') as mock_runner:
-            mock_instance = Mock()
-            mock_instance.run.return_value = []
-            mock_runner.return_value = mock_instance
-
-            for url in valid_urls:
-                response = client.post(
-                    "/analyze",
-                    json={"source": url, "output_format": "json"},
-                    headers=headers
-                )
-                # Should pass validation (might fail on pipeline execution, but that's OK)
-                assert response.status_code in [200, 500]  # 500 if pipeline fails, but validation passed
-
-    def test_output_format_validation(self):
+        for url in valid_urls:
+            response = client.post(
+                "/analyze",
+                json={"source": url, "output_format": "json"},
+                headers=headers
+            )
+            # Should pass validation (might fail on pipeline execution, but that's OK)
+            assert response.status_code in [200, 500]  # 500 if pipeline fails, but validation passed
+
+    def test_output_format_validation(self, client):
         """Test output format validation."""
         headers = {"X-API-Key": "test-api-key-12345"}
 
@@ -221,41 +225,83 @@ class TestSecurity:
         # Test valid output formats
         valid_formats = ["json", "csv"]
 
-        with patch('api.app.PipelineRunner') as mock_runner:
-            mock_instance = Mock()
-            mock_instance.run.return_value = []
-            mock_runner.return_value = mock_instance
-
-            for format_type in valid_formats:
-                response = client.post(
-                    "/analyze",
-                    json={"source": "https://example.com/privacy", "output_format": format_type},
-                    headers=headers
-                )
-                assert response.status_code in [200, 429, 500]  # Should pass validation or be rate limited
+        for format_type in valid_formats:
+            response = client.post(
+                "/analyze",
+                json={"source": "https://example.com/privacy", "output_format": format_type},
+                headers=headers
+            )
+            assert response.status_code in [200, 429, 500]  # Should pass validation or be rate limited
 
-    def test_html_sanitization(self):
+    def test_html_sanitization(self, client):
         """Test HTML sanitization in request content."""
         headers = {"X-API-Key": "test-api-key-12345"}
 
         # Malicious HTML content
         html_content = "<script>alert('xss')</script><p>Safe content</p>"
 
-        with patch('api.app.PipelineRunner') as mock_runner:
-            mock_instance = Mock()
-            mock_instance.run.return_value = []
-            mock_runner.return_value = mock_instance
-
-            response = client.post(
-                "/analyze",
-                json={"source": html_content, "output_format": "json"},
-                headers=headers
-            )
+        response = client.post(
+            "/analyze",
+            json={"source": html_content, "output_format": "json"},
+            headers=headers
+        )
 
-            # Should pass validation (script tags will be sanitized) or be rate limited
-            assert response.status_code in [200, 429, 500]
+        # Should pass validation (script tags will be sanitized) or be rate limited
+        assert response.status_code in [200, 429, 500]
+
+    def test_sanitize_html_removes_active_content(self):
+        """Test that active content is stripped and allowed markup is kept."""
+        html_content = (
+            "<SCRIPT type='text/javascript'>alert('xss')</script >"
+            "<iframe src='https://evil.example'></iframe><embed src='x.swf'>"
+            "<img src=x onerror=alert(1)><svg onload=alert(1)></svg>"
+            "<a href=' JaVa&#x09;script:alert(1)'>Terms</a>"
+            "<p>Safe <b onclick='x()'>content</b></p><a href='/privacy' target='_blank'>Privacy</a>"
+        )
+        assert _sanitize_html(html_content) == (
+            '<a>Terms</a>Safe <b>content</b><a href="/privacy">Privacy</a>'
+        )
 
-    def test_security_headers_present(self):
+        plain_text = "We collect your data"
+        assert _sanitize_html(plain_text) is plain_text
+
+    @pytest.mark.parametrize("html_content, expected", [
+        ('<div style="width: expression(alert(1))">text</div>', 'text'),
+        ('<b style="background: url(javascript:alert(1))">text</b>', '<b>text</b>'),
+        ('<style>body { background: url(javascript:alert(1)) }</style>text', 'text'),
+        ('<p>text</p><meta http-equiv="refresh" content="0;url=https://evil.example">', 'text'),
+        ('<p>text</p><base href="https://evil.example/">', 'text'),
+        ('<p>text</p><link rel="stylesheet" href="https://evil.example/x.css">', 'text'),
+        ('<form action="https://evil.example"><input name="q">text</form>', 'text'),
+        ('<svg><a href="javascript:alert(1)">x</a></svg>text', 'text'),
+        ('<math><mtext><script>alert(1)</script></mtext></math>text', 'text'),
+        ('<a href="data:text/html;base64,PHNjcmlwdD4=">text</a>', '<a>text</a>'),
+        ('<a href="vbscript:msgbox(1)">text</a>', '<a>text</a>'),
+        ('<ul><li>one<!-- note --></li></ul>', '<ul><li>one</li></ul>'),
+        ('<a href="mailto:dpo@example.com" title="DPO">text</a>',
+         '<a href="mailto:dpo@example.com" title="DPO">text</a>'),
+    ])
+    def test_sanitize_html_allowlist(self, html_content, expected):
+        """Test that tags, attributes and URL schemes outside the allowlist are dropped."""
+        assert _sanitize_html(html_content) == expected
+
+    @pytest.mark.slow
+    def test_sanitize_html_unclosed_script_is_linear(self):
+        """Test that sanitizing unclosed script tags scales linearly with input size."""
+        def best_time(n):
+            html_content = "<script>" * n + "<p>Safe content</p>"
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                sanitized = _sanitize_html(html_content)
+                timings.append(time.perf_counter() - start)
+            assert "script" not in sanitized
+            return min(timings)
+
+        # Doubling the input roughly doubles the time; a quadratic scan quadruples it
+        assert best_time(200_000) < 3 * best_time(100_000)
+
+    def test_security_headers_present(self, client):
         """Test that security headers are added to responses."""
         response = client.get("/health")
 
@@ -266,7 +312,7 @@ class TestSecurity:
         assert response.headers.get("Content-Security-Policy") == "default-src 'self'"
         assert response.headers.get("X-XSS-Protection") == "1; mode=block"
 
-    def test_request_id_in_response(self):
+    def test_request_id_in_response(self, client):
         """Test that request ID is included in response headers."""
         response = client.get("/health")
 
@@ -274,7 +320,7 @@ class TestSecurity:
         assert "X-Request-ID" in response.headers
         assert len(response.headers["X-Request-ID"]) == 8  # Should be 8-character ID
 
-    def test_cors_preflight_allowed_origins(self):
+    def test_cors_preflight_allowed_origins(self, client):
         """Test CORS preflight for allowed origins."""
         # Test allowed origin
         response = client.options(
@@ -288,7 +334,15 @@ class TestSecurity:
         assert response.status_code == 200
         assert "Access-Control-Allow-Origin" in response.headers
 
-    def test_cors_preflight_disallowed_origins(self):
+    def test_cors_allowed_origins_is_frozenset(self):
+        """Test that CORS origins are checked against a frozenset."""
+        from fastapi.middleware.cors import CORSMiddleware
+
+        cors = next(m for m in app.user_middleware if m.cls is CORSMiddleware)
+        assert isinstance(cors.kwargs["allow_origins"], frozenset)
+        assert "http://localhost:3000" in cors.kwargs["allow_origins"]
+
+    def test_cors_preflight_disallowed_origins(self, client):
         """Test CORS preflight for disallowed origins."""
         # Test disallowed origin
         response = client.options(
@@ -303,25 +357,20 @@ class TestSecurity:
         # (Exact behavior depends on FastAPI CORS implementation)
         assert response.status_code in [200, 400]
 
-    def test_request_timeout_handling(self):
+    def test_request_timeout_handling(self, client):
         """Test request timeout handling."""
         headers = {"X-API-Key": "test-api-key-12345"}
 
-        with patch('api.app.PipelineRunner') as mock_runner:
-            mock_instance = Mock()
-            mock_instance.run.return_value = []
-            mock_runner.return_value = mock_instance
-
-            response = client.post(
-                "/analyze",
-                json={"source": "https://example.com/privacy", "output_format": "json"},
-                headers=headers
-            )
+        response = client.post(
+            "/analyze",
+            json={"source": "https://example.com/privacy", "output_format": "json"},
+            headers=headers
+        )
 
-            # Should timeout, succeed, or be rate limited
-            assert response.status_code in [200, 408, 429, 500]  # Success, timeout, rate limited, or error
+        # Should timeout, succeed, or be rate limited
+        assert response.status_code in [200, 408, 429, 500]  # Success, timeout, rate limited, or error
 
-    def test_empty_source_validation(self):
+    def test_empty_source_validation(self, client):
         """Test that empty source is rejected."""
         headers = {"X-API-Key": "test-api-key-12345"}
 
@@ -339,7 +388,7 @@ class TestSecurity:
         )
         assert response.status_code == 422  # Pydantic validation error
 
-    def test_error_response_format(self):
+    def test_error_response_format(self, client):
         """Test that error responses include proper information."""
         # Test authentication error
         response = client.post("/analyze", json={
@@ -362,7 +411,7 @@ class TestSecurity:
         error_data = response.json()
         assert "detail" in error_data
 
-    def test_audit_logging_structure(self):
+    def test_audit_logging_structure(self, client):
         """Test that audit logs include required security fields."""
         # This test would typically check log output
         # For now, we'll just ensure the endpoint works and logs are generated
@@ -386,7 +435,7 @@ class TestSecurity:
                 assert "client_ip" in audit_call
                 # Note: user_agent might not be present in test client
 
-    def test_api_key_extraction_methods(self):
+    def test_api_key_extraction_methods(self, client):
         """Test different methods of providing API key."""
         # Mock request object
         from fastapi import Request
@@ -398,4 +447,53 @@ class TestSecurity:
 
             # This would require more complex mocking to test properly
             # The verify_api_key function is tested implicitly in other tests
-            pass
\ No newline at end of file
+            pass
+
+
+class TestRateLimiter:
+    """Test suite for the sliding-window rate limiter."""
+
+    def test_parse_limit(self):
+        """Test parsing of limit strings."""
+        assert parse_limit("10/minute") == (10, 60)
+        assert parse_limit("5/seconds") == (5, 1)
+        with pytest.raises(ValueError):
+            parse_limit("10/fortnight")
+
+    def test_sliding_window_limits_within_window(self):
+        """Test that a window allows its limit, then resets once old hits age out."""
+        window = SlidingWindow(limit=3, window=10)
+
+        assert [window.hit("client", 0.0) for _ in range(4)] == [True, True, True, False]
+        assert window.hit("client", 9.9) is False
+        assert window.hit("client", 25.0) is True
+
+    def test_sliding_window_weights_previous_window(self):
+        """Test that the previous window's hits count in proportion to their overlap."""
+        window = SlidingWindow(limit=4, window=10)
+
+        assert all(window.hit("client", 9.0) for _ in range(4))
+        # Halfway into the next window, 4 * 0.5 = 2 hits still count
+        assert [window.hit("client", 15.0) for _ in range(3)] == [True, True, False]
+
+    def test_limiter_is_keyed_by_client(self):
+        """Test that each client gets its own window."""
+        limiter = Limiter(key_func=lambda request: request.client.host)
+
+        @limiter.limit("2/minute")
+        async def endpoint(request):
+            return "ok"
+
+        def make_request(host):
+            request = Mock()
+            request.client.host = host
+            return request
+
+        async def call(host):
+            return await endpoint(request=make_request(host))
+
+        assert asyncio.run(call("10.0.0.1")) == "ok"
+        assert asyncio.run(call("10.0.0.1")) == "ok"
+        with pytest.raises(RateLimitExceeded):
+            asyncio.run(call("10.0.0.1"))
+        assert asyncio.run(call("10.0.0.2")) == "ok"
@@ -10,36 +10,67 @@ import uuid
 import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
+from decimal import Decimal
 import json
 
-from db.session import init_db, drop_db, get_db_sync
-from db.models import ConsentRecord, ClauseRecord, JobRecord
-from worker.queue import enqueue_task, get_job_status, create_job_record, update_job_record
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import raiseload, selectinload, sessionmaker
+
+# Imported up front: the app initializes the database on import, which would
+# otherwise commit a test's outer transaction on the shared SQLite connection
+from api.app import run_analysis_with_storage
+from db.session import engine, init_db, drop_db, get_db_sync
+from db.models import ConsentRecord, ClauseRecord, JobRecord, generate_job_id, uuid7
+from worker.queue import (
+    enqueue_task, enqueue_tasks_bulk, get_job_status, get_jobs_status,
+    get_queue_info, create_job_record, create_job_records_bulk, update_job_record,
+    cleanup_old_jobs, JobSerializer, JOB_EVENTS_CHANNEL
+)
 from micro_consent_pipeline.pipeline_runner import PipelineRunner
 
 
-class TestDatabasePersistence:
-    """Test database initialization and record creation."""
+@pytest.fixture(scope="module")
+def test_engine():
+    """Create the database schema once for the module."""
+    init_db()
+    yield engine
+    drop_db()
 
-    @pytest.fixture(autouse=True)
-    def setup_test_db(self):
-        """Set up test database."""
-        # Use in-memory SQLite for testing
-        import os
-        original_db_url = os.environ.get('DATABASE_URL')
-        os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
 
-        # Initialize database
-        init_db()
+@pytest.fixture
+def db_connection(test_engine, monkeypatch):
+    """
+    Run a test inside a transaction that is rolled back afterwards.
+
+    Sessions from get_db_sync() are bound to the test connection, and their
+    commits release SAVEPOINTs instead of committing the outer transaction.
+    """
+    connection = test_engine.connect()
+    dbapi_connection = connection.connection.dbapi_connection
+    if test_engine.dialect.name == "sqlite":
+        # pysqlite's implicit transactions break SAVEPOINT; manage BEGIN ourselves
+        isolation_level = dbapi_connection.isolation_level
+        dbapi_connection.isolation_level = None
+    transaction = connection.begin()
+    if test_engine.dialect.name == "sqlite":
+        connection.exec_driver_sql("BEGIN")
+
+    monkeypatch.setattr(
+        'db.session.SessionLocal',
+        sessionmaker(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
+    )
+
+    yield connection
 
-        yield
+    transaction.rollback()
+    if test_engine.dialect.name == "sqlite":
+        dbapi_connection.isolation_level = isolation_level
+    connection.close()
 
-        # Clean up
-        drop_db()
-        if original_db_url:
-            os.environ['DATABASE_URL'] = original_db_url
-        elif 'DATABASE_URL' in os.environ:
-            del os.environ['DATABASE_URL']
+
+@pytest.mark.usefixtures("db_connection")
+class TestDatabasePersistence:
+    """Test database initialization and record creation."""
 
     def test_database_initialization(self):
         """Test that database tables are created correctly."""
@@ -114,7 +145,10 @@ class TestDatabasePersistence:
             db.commit()
 
             # Verify the relationship
-            saved_consent = db.query(ConsentRecord).first()
+            # Eager-load clauses; any other lazy load raises
+            saved_consent = db.query(ConsentRecord).options(
+                selectinload(ConsentRecord.clauses), raiseload("*")
+            ).first()
             assert len(saved_consent.clauses) == 1
 
             saved_clause = saved_consent.clauses[0]
@@ -129,7 +163,7 @@ class TestDatabasePersistence:
         """Test creating JobRecord for async processing."""
         db = get_db_sync()
         try:
-            job_id = str(uuid.uuid4())
+            job_id = generate_job_id()
 
             job_record = JobRecord(
                 id=job_id,
@@ -151,6 +185,52 @@ class TestDatabasePersistence:
         finally:
             db.close()
 
+    def test_cleanup_old_jobs_in_batches(self):
+        """Test old job records and Redis jobs are deleted batch by batch."""
+        old = datetime.utcnow() - timedelta(days=30)
+        db = get_db_sync()
+        try:
+            db.add_all(
+                [JobRecord(id=f"old-{i}", source_url="https://example.com", created_at=old) for i in range(5)]
+                + [JobRecord(id="recent", source_url="https://example.com")]
+            )
+            db.commit()
+        finally:
+            db.close()
+
+        with patch('worker.queue.redis_conn') as mock_redis:
+            pipe = mock_redis.pipeline.return_value.__enter__.return_value
+            deleted = cleanup_old_jobs(days=7, batch_size=2)
+
+        assert deleted == 5
+        assert pipe.execute.call_count == 3
+        assert pipe.delete.call_count == 5
+        pipe.delete.assert_any_call(b"rq:job:old-0", "rq:job:old-0:dependents", "rq:results:old-0")
+        # Registries are cleaned too, so failed_count no longer counts deleted jobs
+        failed_removed = [
+            job_id for call in pipe.zrem.call_args_list if call.args[0] == "rq:failed:default"
+            for job_id in call.args[1:]
+        ]
+        assert sorted(failed_removed) == [f"old-{i}" for i in range(5)]
+        db = get_db_sync()
+        try:
+            assert [record.id for record in db.query(JobRecord).all()] == ["recent"]
+        finally:
+            db.close()
+
+    def test_job_ids_are_time_ordered_uuid7(self):
+        """Test that generated job IDs are version 7 UUIDs in creation order."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first.version == 7
+        assert first.variant == uuid.RFC_4122
+        assert str(first) < str(second)
+        job_id = generate_job_id()
+        assert len(job_id) == 32
+        assert uuid.UUID(hex=job_id).version == 7
+
     def test_pipeline_runner_database_save(self):
         """Test PipelineRunner saving results to database."""
         # Mock the pipeline components
@@ -191,7 +271,7 @@ class TestDatabasePersistence:
                     # Verify data was saved to database
                     db = get_db_sync()
                     try:
-                        consent_records = db.query(ConsentRecord).all()
+                        consent_records = db.query(ConsentRecord).options(selectinload(ConsentRecord.clauses)).all()
                         assert len(consent_records) == 1
 
                         record = consent_records[0]
@@ -199,7 +279,7 @@ class TestDatabasePersistence:
                         assert record.source_url == "https://example.com/privacy"
 
                         # Check clauses
-                        clauses = db.query(ClauseRecord).filter(ClauseRecord.consent_id == record.id).all()
+                        clauses = record.clauses
                         assert len(clauses) == 2
 
                         categories = [clause.category for clause in clauses]
@@ -223,7 +303,8 @@ class TestAsyncJobQueue:
                 mock_job.id = "test-job-123"
                 mock_queue.enqueue.return_value = mock_job
 
-                yield mock_redis, mock_queue
+                with patch.dict('worker.queue._QUEUES', {'default': mock_queue}):
+                    yield mock_redis, mock_queue
 
     def test_job_record_creation_function(self):
         """Test create_job_record function."""
@@ -248,28 +329,84 @@ class TestAsyncJobQueue:
             mock_db.commit.assert_called_once()
             mock_db.close.assert_called_once()
 
+    @pytest.mark.usefixtures("db_connection")
     def test_job_record_update_function(self):
         """Test update_job_record function."""
-        with patch('worker.queue.get_db_sync') as mock_get_db:
-            mock_db = Mock()
-            mock_job_record = Mock()
-            mock_db.query.return_value.filter.return_value.first.return_value = mock_job_record
-            mock_get_db.return_value = mock_db
-
-            job_id = "test-job-123"
+        job_id = "test-job-123"
+        consent_id = uuid.uuid4()
+        create_job_record(job_id=job_id, source_url="https://example.com/privacy")
 
+        with patch('worker.queue.redis_conn') as mock_redis:
             update_job_record(
                 job_id=job_id,
                 status="finished",
-                consent_record_id="consent-123",
+                consent_record_id=str(consent_id),
                 result_data={"success": True}
             )
+            mock_redis.publish.assert_called_once()
+
+        # Verify updates
+        db = get_db_sync()
+        try:
+            job_record = db.query(JobRecord).filter(JobRecord.id == job_id).one()
+            assert job_record.status == "finished"
+            assert job_record.finished_at is not None
+            assert job_record.consent_record_id == consent_id
+            assert job_record.result_data == {"success": True}
+        finally:
+            db.close()
+
+    @pytest.mark.usefixtures("db_connection")
+    def test_job_record_update_publishes_completion(self, setup_test_environment):
+        """Test finished and failed updates are announced on the events channel."""
+        mock_redis, _ = setup_test_environment
+        create_job_record(job_id="test-job-123", source_url="https://example.com/privacy")
+
+        update_job_record(job_id="test-job-123", status="started")
+        mock_redis.publish.assert_not_called()
+
+        # No event for a job without a record
+        update_job_record(job_id="missing-job", status="finished")
+        mock_redis.publish.assert_not_called()
+
+        # No event when the update is rolled back
+        with patch('worker.queue.get_db_sync') as mock_get_db:
+            mock_get_db.return_value.execute.side_effect = RuntimeError("db down")
+            update_job_record(job_id="test-job-123", status="finished")
+        mock_redis.publish.assert_not_called()
+
+        update_job_record(job_id="test-job-123", status="failed", error_message="boom")
+        channel, message = mock_redis.publish.call_args.args
+        assert channel == JOB_EVENTS_CHANNEL
+        assert JobSerializer.loads(message) == {
+            "id": "test-job-123", "status": "failed", "extra": {"error": "boom"}
+        }
+
+    @pytest.mark.usefixtures("db_connection")
+    def test_job_record_update_malformed_consent_id(self):
+        """Test that a malformed consent record ID is logged instead of raised."""
+        create_job_record(job_id="test-job-123", source_url="https://example.com/privacy")
+
+        with patch('worker.queue.redis_conn') as mock_redis:
+            update_job_record(job_id="test-job-123", status="finished", consent_record_id="not-a-uuid")
+        mock_redis.publish.assert_not_called()
 
-            # Verify updates
-            assert mock_job_record.status == "finished"
-            assert mock_job_record.consent_record_id == "consent-123"
-            assert mock_job_record.result_data == {"success": True}
+        db = get_db_sync()
+        try:
+            assert db.query(JobRecord).filter(JobRecord.id == "test-job-123").one().status == "queued"
+        finally:
+            db.close()
 
+    def test_job_record_update_is_single_statement(self):
+        """Test update_job_record issues one UPDATE without loading the record."""
+        with patch('worker.queue.get_db_sync') as mock_get_db:
+            mock_db = Mock()
+            mock_get_db.return_value = mock_db
+
+            update_job_record(job_id="test-job-123", status="started")
+
+            mock_db.query.assert_not_called()
+            mock_db.execute.assert_called_once()
             mock_db.commit.assert_called_once()
             mock_db.close.assert_called_once()
 
@@ -292,17 +429,93 @@ class TestAsyncJobQueue:
             assert args[2] == "args"
             assert 'job_id' in kwargs
 
+            # Job writes are sent through a single pipeline
+            pipe = mock_redis.pipeline.return_value.__enter__.return_value
+            assert kwargs['pipeline'] is pipe
+            pipe.execute.assert_called_once()
+
+    def test_enqueue_tasks_bulk_function(self, setup_test_environment):
+        """Test enqueue_tasks_bulk enqueues all jobs in one call."""
+        mock_redis, mock_queue = setup_test_environment
+        mock_queue.enqueue_many.side_effect = lambda job_datas: [
+            Mock(id=job_data.job_id) for job_data in job_datas
+        ]
+
+        def dummy_function(url, output_format):
+            return f"result: {url} {output_format}"
+
+        args_list = [("https://a.example", "json"), ("https://b.example", "csv")]
+        job_ids = enqueue_tasks_bulk(dummy_function, args_list, job_ids=["job-a", "job-b"])
+
+        assert job_ids == ["job-a", "job-b"]
+        mock_queue.enqueue_many.assert_called_once()
+        job_datas = mock_queue.enqueue_many.call_args.args[0]
+        assert [job_data.args for job_data in job_datas] == args_list
+        assert all(job_data.func is dummy_function for job_data in job_datas)
+
+        with pytest.raises(ValueError):
+            enqueue_tasks_bulk(dummy_function, args_list, job_ids=["job-a"])
+
+    @pytest.mark.usefixtures("db_connection")
+    def test_job_records_bulk_creation_function(self):
+        """Test create_job_records_bulk inserts every record."""
+        create_job_records_bulk([
+            {"job_id": "job-a", "source_url": "https://a.example"},
+            {"job_id": "job-b", "source_url": "https://b.example", "output_format": "csv"},
+        ])
+
+        db = get_db_sync()
+        try:
+            records = db.query(JobRecord).order_by(JobRecord.id).all()
+            assert [record.id for record in records] == ["job-a", "job-b"]
+            assert [record.output_format for record in records] == ["json", "csv"]
+            assert all(record.status == "queued" for record in records)
+            assert all(record.created_at is not None for record in records)
+        finally:
+            db.close()
+
+    def test_job_serializer_round_trip(self):
+        """Test job data is stored as JSON and large payloads are compressed."""
+        job_tuple = ("api.app.run_analysis_with_storage", None, ("https://example.com", "json"), {})
+        data = JobSerializer.dumps(job_tuple)
+        assert data.startswith(JobSerializer.FORMAT_JSON + b"[")
+        func_name, instance, args, kwargs = JobSerializer.loads(data)
+        assert func_name == "api.app.run_analysis_with_storage"
+        assert instance is None
+        assert list(args) == ["https://example.com", "json"]
+
+        result = {"success": True, "items": [{"text": "Accept all cookies " * 10}] * 20}
+        data = JobSerializer.dumps(result)
+        assert data.startswith(JobSerializer.FORMAT_JSON_ZLIB)
+        assert len(data) < JobSerializer.COMPRESS_THRESHOLD
+        assert JobSerializer.loads(data) == result
+
+    @pytest.mark.parametrize("value", [
+        datetime(2024, 1, 1), uuid.uuid4(), Decimal("1.5"), object()
+    ])
+    def test_job_serializer_rejects_non_json_types(self, value):
+        """Test that values JSON cannot represent fail at enqueue time instead of becoming strings."""
+        with pytest.raises(TypeError):
+            JobSerializer.dumps({"value": value})
+
+    def test_job_serializer_rejects_unknown_format(self):
+        """Test that payloads without a known format byte are rejected."""
+        with pytest.raises(ValueError):
+            JobSerializer.loads(b"x\x9c")
+
     def test_get_job_status_function(self):
         """Test get_job_status function."""
+        from rq.results import Result
+
         with patch('worker.queue.Job') as mock_job_class:
             mock_job = Mock()
             mock_job.get_status.return_value = "finished"
             mock_job.created_at = datetime.utcnow()
             mock_job.started_at = datetime.utcnow()
             mock_job.ended_at = datetime.utcnow()
-            mock_job.is_finished = True
-            mock_job.is_failed = False
-            mock_job.result = {"success": True, "items": []}
+            mock_job.latest_result.return_value = Mock(
+                type=Result.Type.SUCCESSFUL, return_value={"success": True, "items": []}
+            )
             mock_job.meta = {"progress": 100}
 
             mock_job_class.fetch.return_value = mock_job
@@ -315,6 +528,9 @@ class TestAsyncJobQueue:
             assert status["result"] == {"success": True, "items": []}
             assert status["progress"] == 100
 
+            # The status comes from the fetched hash, not another HGET
+            mock_job.get_status.assert_called_once_with(refresh=False)
+
     def test_get_job_status_not_found(self):
         """Test get_job_status for non-existent job."""
         from rq.exceptions import NoSuchJobError
@@ -329,30 +545,62 @@ class TestAsyncJobQueue:
             assert status["status"] == "not_found"
             assert "error" in status
 
+    def test_get_jobs_status_function(self, setup_test_environment):
+        """Test get_jobs_status reads all jobs and results in two round-trips."""
+        from rq.job import JobStatus
+        from rq.results import Result
 
-class TestIntegration:
-    """Integration tests for database and async functionality."""
-
-    @pytest.fixture(autouse=True)
-    def setup_integration_test(self):
-        """Set up integration test environment."""
-        import os
+        mock_redis, _ = setup_test_environment
 
-        # Use in-memory SQLite for testing
-        original_db_url = os.environ.get('DATABASE_URL')
-        os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+        def make_job(job_id, status):
+            job = Mock(id=job_id, created_at=datetime.utcnow(), started_at=None,
+                       ended_at=None, meta={"progress": 100})
+            job.get_status.return_value = status
+            return job
 
-        # Initialize database
-        init_db()
+        finished = make_job("job-done", JobStatus.FINISHED)
+        queued = make_job("job-queued", JobStatus.QUEUED)
+        payload = Result("job-done", Result.Type.SUCCESSFUL, connection=mock_redis,
+                         return_value={"success": True}, serializer=JobSerializer).serialize()
+        raw_payload = {k.encode(): str(v).encode() for k, v in payload.items()}
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        pipe.execute.return_value = [[(b"1700000000000-0", raw_payload)]]
 
-        yield
-
-        # Clean up
-        drop_db()
-        if original_db_url:
-            os.environ['DATABASE_URL'] = original_db_url
-        elif 'DATABASE_URL' in os.environ:
-            del os.environ['DATABASE_URL']
+        with patch('worker.queue.Job') as mock_job_class:
+            mock_job_class.fetch_many.return_value = [finished, None, queued]
+
+            statuses = get_jobs_status(["job-done", "job-missing", "job-queued"])
+
+        mock_job_class.fetch_many.assert_called_once()
+        pipe.xrevrange.assert_called_once()
+        finished.get_status.assert_called_with(refresh=False)
+        assert [s["status"] for s in statuses] == [JobStatus.FINISHED, "not_found", JobStatus.QUEUED]
+        assert statuses[0]["result"] == {"success": True}
+        assert statuses[0]["progress"] == 100
+        assert statuses[2]["result"] is None
+
+    def test_get_queue_info_single_round_trip(self, setup_test_environment):
+        """Test get_queue_info reads all counts through one pipeline."""
+        mock_redis, _ = setup_test_environment
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        pipe.execute.return_value = list(range(12))
+
+        info = get_queue_info()
+
+        pipe.execute.assert_called_once()
+        assert pipe.llen.call_count == 3
+        assert pipe.zcard.call_count == 9
+        assert info['high_priority'] == {
+            'name': 'high', 'length': 0, 'failed_count': 1,
+            'started_count': 2, 'finished_count': 3,
+        }
+        assert info['low_priority']['name'] == 'low'
+        assert info['low_priority']['finished_count'] == 11
+
+
+@pytest.mark.usefixtures("db_connection")
+class TestIntegration:
+    """Integration tests for database and async functionality."""
 
     @patch('worker.queue.redis_conn')
     @patch('worker.queue.default_queue')
@@ -393,8 +641,6 @@ class TestIntegration:
                     )
 
                     # Step 2: Simulate job execution (run_analysis_with_storage)
-                    from api.app import run_analysis_with_storage
-
                     with patch('api.app.update_job_record') as mock_update:
                         result = run_analysis_with_storage(source_url, "json", job_id)
 
@@ -406,11 +652,17 @@ class TestIntegration:
                         # Verify job updates were called
                         assert mock_update.call_count >= 2  # Started and finished
 
+                        # The job record keeps only the summary, not the items
+                        stored = mock_update.call_args.kwargs["result_data"]
+                        assert "items" not in stored
+                        assert stored["total_items"] == 1
+                        assert stored["categories"] == {"necessary": 1}
+
                     # Step 3: Verify database state
                     db = get_db_sync()
                     try:
                         # Check consent record was created
-                        consent_records = db.query(ConsentRecord).all()
+                        consent_records = db.query(ConsentRecord).options(selectinload(ConsentRecord.clauses)).all()
                         assert len(consent_records) == 1
 
                         record = consent_records[0]
@@ -419,7 +671,7 @@ class TestIntegration:
                         assert record.status == "completed"
 
                         # Check clause record was created
-                        clauses = db.query(ClauseRecord).filter(ClauseRecord.consent_id == record.id).all()
+                        clauses = record.clauses
                         assert len(clauses) == 1
 
                         clause = clauses[0]
@@ -434,17 +686,18 @@ class TestIntegration:
         """Test database query performance with multiple records."""
         db = get_db_sync()
         try:
-            # Create multiple consent records
-            for i in range(50):
-                record = ConsentRecord(
+            # Create multiple consent records in one bulk insert
+            records = [
+                ConsentRecord(
                     source_url=f"https://example{i}.com/privacy",
                     total_items=5,
                     data={"categories": {"necessary": 2, "analytics": 3}},
                     status="completed"
                 )
-                db.add(record)
-
-            db.commit()
+                for i in range(50)
+            ]
+            with db.begin():
+                db.bulk_save_objects(records)
 
             # Test query performance
             start_time = time.time()
@@ -460,10 +713,23 @@ class TestIntegration:
             assert len(recent_records) == 10
             assert query_time < 1.0  # Should complete in under 1 second
 
+            # The recent-records query should range-scan the created_at index, not sort the table
+            if db.get_bind().dialect.name == "sqlite":
+                plan = db.execute(
+                    text(
+                        "EXPLAIN QUERY PLAN SELECT id FROM consent_records "
+                        "WHERE created_at >= :since ORDER BY created_at DESC LIMIT 10"
+                    ),
+                    {"since": datetime.utcnow() - timedelta(days=1)}
+                ).fetchall()
+                details = " ".join(row[-1] for row in plan)
+                assert "ix_consent_records_created_at" in details
+                assert "TEMP B-TREE" not in details
+
             # Test aggregation query
             start_time = time.time()
 
-            total_items = db.query(ConsentRecord).count()
+            total_items = db.execute(select(func.count()).select_from(ConsentRecord)).scalar()
 
             agg_time = time.time() - start_time
 
@@ -478,8 +744,6 @@ class TestIntegration:
         with patch('micro_consent_pipeline.ingestion.extractor.ConsentExtractor.load_source') as mock_load:
             mock_load.side_effect = Exception("Network error")
 
-            from api.app import run_analysis_with_storage
-
             job_id = "error-test-job"
 
             with patch('api.app.update_job_record') as mock_update:
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 from micro_consent_pipeline import __version__
+from micro_consent_pipeline.cli import main as cli_main
 
 
 def test_version_file_matches_package_version():
@@ -13,20 +14,26 @@ def test_version_file_matches_package_version():
     assert file_version == __version__, f"VERSION file ({file_version}) != package version ({__version__})"
 
 
-def test_cli_version_flag_outputs_version():
-    # Run the CLI with --version
+def test_cli_version_flag_outputs_version(capsys):
+    # Run the CLI entry point in-process with --version
+    with pytest.raises(SystemExit) as exc_info:
+        cli_main(['--version'])
+
+    assert exc_info.value.code == 0
+    assert __version__ in capsys.readouterr().out
+
+
+@pytest.mark.slow
+def test_cli_version_flag_subprocess():
+    # Smoke test the real script entry point
     res = subprocess.run([sys.executable, str(Path(__file__).parents[2] / 'main.py'), '--version'], capture_output=True, text=True)
     assert res.returncode == 0
     assert __version__ in res.stdout
 
 
-def test_health_endpoint_returns_version():
-    # Start the FastAPI app and query /health using TestClient
-    from api.app import app
-    from fastapi.testclient import TestClient
-
-    with TestClient(app) as client:
-        resp = client.get('/health')
+def test_health_endpoint_returns_version(client):
+    # Query /health through the shared session TestClient
+    resp = client.get('/health')
 
     assert resp.status_code == 200
     data = resp.json()
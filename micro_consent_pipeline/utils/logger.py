@@ -6,11 +6,41 @@ Logger utility for consistent logging across the application with JSON structure
 """
 
 import logging
-import uuid
+import secrets
 from typing import Dict, List, Optional
 
 from pythonjsonlogger import jsonlogger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonFormatter(jsonlogger.JsonFormatter):
+    """
+    JSON log formatter that serializes records with orjson.
+    """
+
+    def jsonify_log_record(self, log_record) -> str:
+        """
+        Serialize a log record to a JSON string.
+
+        Args:
+            log_record: Log record fields to serialize.
+
+        Returns:
+            str: JSON-encoded log record.
+        """
+        return orjson.dumps(log_record, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Fall back to the stdlib json serializer when orjson is not installed
+_JsonFormatter = OrjsonFormatter if orjson is not None else jsonlogger.JsonFormatter
+
+# Logger for the summary helpers, bound once at import
+_LOGGER = logging.getLogger(__name__)
+
 
 def setup_json_logger(name: str, level: str = "INFO") -> logging.Logger:
     """
@@ -26,15 +56,20 @@ def setup_json_logger(name: str, level: str = "INFO") -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
+    # Already configured: keep the existing handler instead of rebuilding it
+    if any(getattr(h, "_json_handler", False) for h in logger.handlers):
+        return logger
+
     # Clear existing handlers
     logger.handlers.clear()
 
     handler = logging.StreamHandler()
-    formatter = jsonlogger.JsonFormatter(
+    formatter = _JsonFormatter(
         fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
         datefmt="%Y-%m-%dT%H:%M:%S"
     )
     handler.setFormatter(formatter)
+    handler._json_handler = True
     logger.addHandler(handler)
     return logger
 
@@ -73,7 +108,7 @@ def generate_request_id() -> str:
     Returns:
         str: Unique request ID.
     """
-    return str(uuid.uuid4())[:8]
+    return secrets.token_hex(4)
 
 
 def log_inference_summary(count: int, elapsed_time: float, categories: List[str], request_id: Optional[str] = None) -> None:
@@ -86,11 +121,14 @@ def log_inference_summary(count: int, elapsed_time: float, categories: List[str]
         categories (List[str]): List of categories assigned.
         request_id (Optional[str]): Request ID for tracking.
     """
-    logger = get_logger(__name__)
+    logger = _LOGGER
+    # Skip building the record when INFO is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
     extra = {
         "duration_ms": elapsed_time * 1000,
         "items": count,
-        "categories": list(set(categories)),
+        "categories": list(dict.fromkeys(categories)),  # Dedupe, keeping first-seen order
         "request_id": request_id or generate_request_id()
     }
     logger.info("Processed %d clauses in %.2f seconds", count, elapsed_time, extra=extra)
@@ -106,7 +144,9 @@ def log_pipeline_summary(duration: float, total_items: int, categories: Dict[str
         categories (Dict[str, int]): Count of items per category.
         request_id (Optional[str]): Request ID for tracking.
     """
-    logger = get_logger(__name__)
+    logger = _LOGGER
+    if not logger.isEnabledFor(logging.INFO):
+        return
     extra = {
         "duration_ms": duration * 1000,
         "items": total_items,
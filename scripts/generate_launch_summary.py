@@ -2,18 +2,47 @@
 """
 Generates LAUNCH_SUMMARY.md for the Micro-Consent-Pipeline project.
 Reads VERSION, CHANGELOG.md, README.md, and MODULE_*_SUMMARY.md files.
+Module summaries are cached in .cache/ until one of those files changes.
 """
 
+import fnmatch
+import json
+import os
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
+@lru_cache(maxsize=None)
 def read_file(filepath):
-    """Read file content, return empty string if not found."""
+    """Read file content (cached per path), return empty string if not found."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+        return Path(filepath).read_text(encoding='utf-8')
     except FileNotFoundError:
         return ""
 
+def iter_lines(filepath):
+    """Yield file lines lazily without newlines, yield nothing if not found."""
+    try:
+        data = Path(filepath).read_bytes()
+    except FileNotFoundError:
+        return
+    # Scan for line breaks in the raw bytes and decode only the lines consumed
+    pos = 0
+    while pos < len(data):
+        nl = data.find(b'\n', pos)
+        end = len(data) if nl < 0 else nl
+        line = data[pos:end]
+        if line.endswith(b'\r'):
+            line = line[:-1]
+        yield line.decode('utf-8', 'replace')
+        if nl < 0:
+            break
+        pos = nl + 1
+
+def head_lines(filepath, n):
+    """Read only the first n lines of a file."""
+    return list(islice(iter_lines(filepath), n))
+
 def extract_version():
     """Extract version from VERSION file."""
     version = read_file("VERSION").strip()
@@ -21,54 +50,74 @@ def extract_version():
 
 def extract_changelog_summary():
     """Extract recent changelog entries."""
-    changelog = read_file("CHANGELOG.md")
-    # Extract the first few lines after header
-    lines = changelog.split('\n')
+    # Only the first 20 lines are needed, so stop reading there
+    lines = head_lines("CHANGELOG.md", 20)
     summary = []
-    for line in lines[4:20]:  # Skip header, take next 16 lines
+    for line in lines[4:]:  # Skip header, take next 16 lines
         if line.strip() and not line.startswith('## '):
             summary.append(line)
         if len(summary) >= 5:
             break
     return '\n'.join(summary)
 
+# Link and image lines (badges) are not part of the description
+_BADGE_PREFIXES = ('[', '!')
+
 def extract_readme_description():
     """Extract project description from README.md."""
-    readme = read_file("README.md")
-    # Find the first paragraph after title
-    lines = readme.split('\n')
+    # Find the first paragraph after title, reading no further than its end
     description = []
     in_description = False
-    for line in lines:
+    for line in iter_lines("README.md"):
         if line.startswith('# '):
             continue
-        if line.strip() and not line.startswith('[') and not line.startswith('!'):
+        stripped = line.strip()
+        if stripped and not line.startswith(_BADGE_PREFIXES):
             description.append(line)
             in_description = True
-        elif in_description and line.strip() == '':
+        elif in_description and not stripped:
             break
     return '\n'.join(description[:3])  # First 3 lines
 
+MODULES_CACHE = Path('.cache') / 'launch_modules.json'
+# Bump when the cached summary format changes
+MODULES_CACHE_VERSION = 1
+
 def collect_module_summaries():
-    """Collect summaries from MODULE_*_SUMMARY.md files."""
+    """Collect summaries from MODULE_*_SUMMARY.md files, reusing the cache if unchanged."""
+    with os.scandir('.') as entries:
+        module_files = [
+            (entry.name, entry.path, entry.stat().st_mtime_ns) for entry in entries
+            if fnmatch.fnmatchcase(entry.name, 'MODULE_*_SUMMARY.md') and entry.is_file()
+        ]
+    # Any added, removed or modified summary file, or an edit to this script, changes the key
+    key = [f"version:{MODULES_CACHE_VERSION}", f"script:{os.stat(__file__).st_mtime_ns}"]
+    key += [f"{name}:{mtime}" for name, _, mtime in sorted(module_files)]
+    try:
+        cached = json.loads(MODULES_CACHE.read_text(encoding='utf-8'))
+        if cached['key'] == key:
+            return cached['summaries']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
     summaries = []
-    for file in Path('.').glob('MODULE_*_SUMMARY.md'):
-        content = read_file(str(file))
+    for name, path, _ in module_files:
+        content = read_file(path)
         if content:
             # Extract title and first paragraph
-            lines = content.split('\n')
-            title = lines[0].replace('# ', '') if lines else str(file)
+            lines = content.split('\n', 4)[:4]  # Only the title and next 3 lines are used
+            title = lines[0].lstrip('#').strip() if lines else name
             summary = '\n'.join(lines[1:4]) if len(lines) > 1 else ""
             summaries.append(f"**{title}**\n{summary}")
-    return summaries
 
-def generate_summary():
-    """Generate the full launch summary."""
-    version = extract_version()
-    description = extract_readme_description()
-    modules = collect_module_summaries()
+    try:
+        MODULES_CACHE.parent.mkdir(exist_ok=True)
+        MODULES_CACHE.write_text(json.dumps({'key': key, 'summaries': summaries}), encoding='utf-8')
+    except OSError:
+        pass  # The cache is only an optimisation
+    return summaries
 
-    summary = f"""# 🚀 Micro-Consent-Pipeline Launch Summary
+_HEADER = """# 🚀 Micro-Consent-Pipeline Launch Summary
 
 ## Project Overview
 
@@ -80,13 +129,8 @@ def generate_summary():
 
 ### Modules Completed
 """
-    if modules:
-        for mod in modules:
-            summary += f"- {mod}\n"
-    else:
-        summary += "- Module 1-10: Core pipeline, database, async processing, CI/CD, governance\n"
 
-    summary += f"""
+_FOOTER = """
 ## Tech Stack
 
 | Component | Technology | Purpose |
@@ -143,15 +187,27 @@ streamlit run dashboard/app.py
 
 ## Recent Changes
 
-{extract_changelog_summary()}
+{changelog}
 
 ---
 
 *Generated automatically for release {version}*
 """
 
+def generate_summary():
+    """Generate the full launch summary."""
+    version = extract_version()
+    header = _HEADER.format(version=version, description=extract_readme_description())
+    modules = collect_module_summaries() or [
+        "Module 1-10: Core pipeline, database, async processing, CI/CD, governance"
+    ]
+    footer = _FOOTER.format(version=version, changelog=extract_changelog_summary())
+
+    # Write the sections straight to the file rather than joining them first
     with open("LAUNCH_SUMMARY.md", 'w', encoding='utf-8') as f:
-        f.write(summary)
+        f.write(header)
+        f.writelines(f"- {mod}\n" for mod in modules)
+        f.write(footer)
 
     print("✅ LAUNCH_SUMMARY.md generated successfully")
 
@@ -120,6 +120,9 @@ fi
 # Add Redis URL
 RQ_CMD="$RQ_CMD --url $REDIS_URL"
 
+# Jobs are stored as JSON by the application's serializer, not pickle
+RQ_CMD="$RQ_CMD --serializer worker.queue.JobSerializer"
+
 echo "Starting worker with command: $RQ_CMD"
 echo ""
 
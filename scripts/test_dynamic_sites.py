@@ -10,9 +10,11 @@ Tests major news websites that typically have complex consent banners.
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class DynamicConsentTester:
@@ -37,6 +39,13 @@ class DynamicConsentTester:
             'Content-Type': 'application/json'
         }
 
+        # One keep-alive session so requests to the API host reuse connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def test_site(self, name: str, url: str) -> Tuple[str, str, int]:
         """
         Test consent detection for a single site.
@@ -48,9 +57,13 @@ class DynamicConsentTester:
         Returns:
             Tuple[str, str, int]: (status_emoji, message, consent_count)
         """
+        # Buffer output so concurrent tests print one block per site
+        lines = ["\n" + "-" * 50]
+        emit = lines.append
+
         try:
-            print(f"\n🔍 Testing {name}...")
-            print(f"   URL: {url}")
+            emit(f"\n🔍 Testing {name}...")
+            emit(f"   URL: {url}")
 
             # Prepare request payload
             payload = {
@@ -59,17 +72,16 @@ class DynamicConsentTester:
                 "timeout": self.timeout
             }
 
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             # Make API request
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_base}/analyze",
-                headers=self.headers,
                 json=payload,
                 timeout=self.timeout
             )
 
-            elapsed_time = time.time() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             if response.status_code == 200:
                 result = response.json()
@@ -81,48 +93,51 @@ class DynamicConsentTester:
                 if consent_count > 0:
                     status = "✅"
                     message = f"Found {consent_count} consent elements in {elapsed_time:.1f}s"
-                    print(f"   {status} {message}")
+                    emit(f"   {status} {message}")
 
                     # Show sample elements
                     for elem in consent_elements[:3]:  # Show first 3
                         elem_type = elem.get('type', 'unknown')
                         elem_text = elem.get('text', '')[:50]  # Truncate long text
-                        print(f"      • {elem_type}: {elem_text}...")
+                        emit(f"      • {elem_type}: {elem_text}...")
 
                     if len(consent_elements) > 3:
-                        print(f"      ... and {len(consent_elements) - 3} more elements")
+                        emit(f"      ... and {len(consent_elements) - 3} more elements")
 
                 else:
                     status = "⚠️"
                     message = f"No consent elements found in {elapsed_time:.1f}s"
-                    print(f"   {status} {message}")
+                    emit(f"   {status} {message}")
 
                 return status, message, consent_count
 
             else:
                 status = "❌"
                 message = f"API error {response.status_code}: {response.text[:100]}"
-                print(f"   {status} {message}")
+                emit(f"   {status} {message}")
                 return status, message, 0
 
         except requests.exceptions.Timeout:
             status = "❌"
             message = f"Request timed out after {self.timeout}s"
-            print(f"   {status} {message}")
+            emit(f"   {status} {message}")
             return status, message, 0
 
         except requests.exceptions.RequestException as e:
             status = "❌"
             message = f"Request failed: {str(e)}"
-            print(f"   {status} {message}")
+            emit(f"   {status} {message}")
             return status, message, 0
 
         except Exception as e:  # Catch any unexpected errors in test script
             status = "❌"
             message = f"Unexpected error: {str(e)}"
-            print(f"   {status} {message}")
+            emit(f"   {status} {message}")
             return status, message, 0
 
+        finally:
+            print("\n".join(lines))
+
     def run_tests(self) -> None:
         """Run tests for all configured sites."""
         print("🚀 Dynamic Consent Detection Test")
@@ -132,14 +147,15 @@ class DynamicConsentTester:
         print(f"Testing {len(self.test_sites)} sites...")
         print("=" * 50)
 
-        results = []
-        total_consent_elements = 0
+        # Requests are network-bound, so test all sites at once; map keeps site order
+        with ThreadPoolExecutor(max_workers=len(self.test_sites)) as executor:
+            outcomes = list(executor.map(lambda site: self.test_site(*site), self.test_sites))
 
-        for name, url in self.test_sites:
-            print("\n" + "-" * 50)
-            status, _, count = self.test_site(name, url)
-            results.append((name, status, count))
-            total_consent_elements += count
+        results = [
+            (name, status, count)
+            for (name, _), (status, _, count) in zip(self.test_sites, outcomes)
+        ]
+        total_consent_elements = sum(count for _, _, count in results)
 
         # Print summary
         print("\n" + "=" * 50)
@@ -14,23 +14,20 @@ import sys
 import time
 import signal
 import logging
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-try:
-    import redis
-    from rq import Worker, Queue
-    from rq.job import Job
-    from worker.queue import redis_conn, start_worker, get_queue_info
-    from db.session import init_db, engine
-    from sqlalchemy import text
-except ImportError as e:
-    print(f"Error: Missing required dependencies: {e}")
-    print("Please install requirements: pip install -r requirements.txt")
-    sys.exit(1)
+# Redis, RQ and the ORM are imported by the methods that need them, so --help
+# and argument errors return without paying for those imports
+if TYPE_CHECKING:
+    from rq import Queue
+
+
+# Set once .env has been loaded, so child invocations skip re-parsing it
+ENV_LOADED_FLAG = 'MCP_DOTENV_LOADED'
 
 
 class WorkerManager:
@@ -53,6 +50,7 @@ class WorkerManager:
         self.log_level = log_level
         self.worker = None
         self.should_stop = False
+        self._queue_objs: Optional[List['Queue']] = None
 
         # Setup logging
         logging.basicConfig(
@@ -72,13 +70,33 @@ class WorkerManager:
         if self.worker:
             self.worker.request_stop()
 
+    def _get_queues(self) -> List['Queue']:
+        """Get the Queue objects for the configured queue names, built once."""
+        if self._queue_objs is None:
+            from rq import Queue
+            from worker.queue import JobSerializer, redis_conn
+
+            self._queue_objs = [
+                Queue(name, connection=redis_conn, serializer=JobSerializer) for name in self.queues
+            ]
+        return self._queue_objs
+
     def test_connections(self) -> bool:
         """Test Redis and database connectivity."""
+        from sqlalchemy import text
+        from worker.queue import redis_conn
+        from db.session import engine
+
         self.logger.info("Testing connections...")
 
-        # Test Redis connection
+        # Test Redis and check the queue keys in one round-trip
         try:
-            redis_conn.ping()
+            queue_objs = self._get_queues()
+            with redis_conn.pipeline(transaction=False) as pipe:
+                pipe.ping()
+                for queue in queue_objs:
+                    pipe.exists(queue.key)
+                _, *queue_exists = pipe.execute()
             self.logger.info("✓ Redis connection successful")
         except Exception as e:
             self.logger.error(f"✗ Redis connection failed: {e}")
@@ -93,14 +111,11 @@ class WorkerManager:
             self.logger.error(f"✗ Database connection failed: {e}")
             return False
 
-        # Test queue accessibility
-        try:
-            queue_objs = [Queue(name, connection=redis_conn) for name in self.queues]
-            queue_names = [q.name for q in queue_objs]
-            self.logger.info(f"✓ Queues accessible: {queue_names}")
-        except Exception as e:
-            self.logger.error(f"✗ Queue access failed: {e}")
-            return False
+        queue_names = [q.name for q in queue_objs]
+        self.logger.info(f"✓ Queues accessible: {queue_names}")
+        empty_queues = [q.name for q, exists in zip(queue_objs, queue_exists) if not exists]
+        if empty_queues:
+            self.logger.info(f"Queues currently empty: {empty_queues}")
 
         return True
 
@@ -111,18 +126,19 @@ class WorkerManager:
         Returns:
             Exit code (0 for success, 1 for error)
         """
+        from rq import Worker
+        from worker.queue import JobSerializer, redis_conn
+
         if not self.test_connections():
             return 1
 
         try:
-            # Get queue objects
-            queue_objs = [Queue(name, connection=redis_conn) for name in self.queues]
-
             # Create worker
             self.worker = Worker(
-                queues=queue_objs,
+                queues=self._get_queues(),
                 connection=redis_conn,
-                name=self.worker_name
+                name=self.worker_name,
+                serializer=JobSerializer
             )
 
             self.logger.info(f"Starting worker '{self.worker.name}' for queues: {self.queues}")
@@ -139,20 +155,44 @@ class WorkerManager:
             return 1
 
     def get_worker_info(self) -> dict:
-        """Get information about running workers."""
+        """
+        Get information about running workers.
+
+        Worker hashes and their current jobs are each fetched in one pipelined
+        round-trip, instead of several Redis calls per worker.
+        """
+        from rq import Worker, worker_registration
+        from rq.job import Job
+        from rq.utils import as_text
+        from worker.queue import JobSerializer, redis_conn
+
         try:
-            workers = Worker.all(connection=redis_conn)
-            worker_info = []
+            worker_keys = sorted(worker_registration.get_keys(connection=redis_conn))
 
-            for worker in workers:
-                info = {
-                    'name': worker.name,
-                    'state': worker.get_state(),
-                    'current_job': None,
-                    'queues': [q.name for q in worker.queues]
-                }
+            with redis_conn.pipeline() as pipe:
+                for key in worker_keys:
+                    pipe.hgetall(key)
+                raw_workers = pipe.execute()
 
-                current_job = worker.get_current_job()
+            prefix = Worker.redis_worker_namespace_prefix
+            worker_info = []
+            for key, raw in zip(worker_keys, raw_workers):
+                if not raw:
+                    continue  # Registered but expired
+                data = {as_text(k): as_text(v) for k, v in raw.items()}
+                worker_info.append({
+                    'name': key[len(prefix):],
+                    'state': data.get('state', '?'),
+                    'current_job': data.get('current_job') or None,
+                    'queues': data['queues'].split(',') if data.get('queues') else []
+                })
+
+            job_ids = [info['current_job'] for info in worker_info if info['current_job']]
+            jobs = dict(zip(job_ids, Job.fetch_many(job_ids, connection=redis_conn, serializer=JobSerializer))) if job_ids else {}
+
+            for info in worker_info:
+                current_job = jobs.get(info['current_job'])
+                info['current_job'] = None
                 if current_job:
                     info['current_job'] = {
                         'id': current_job.id,
@@ -160,11 +200,9 @@ class WorkerManager:
                         'created_at': current_job.created_at.isoformat() if current_job.created_at else None
                     }
 
-                worker_info.append(info)
-
             return {
                 'workers': worker_info,
-                'total_workers': len(workers)
+                'total_workers': len(worker_info)
             }
 
         except Exception as e:
@@ -246,12 +284,14 @@ Examples:
 
     args = parser.parse_args()
 
-    # Load environment variables
-    env_file = Path('.env')
-    if env_file.exists():
-        from dotenv import load_dotenv
-        load_dotenv()
-        print("Loaded environment variables from .env")
+    # Load environment variables once; processes started from here inherit them
+    if not os.environ.get(ENV_LOADED_FLAG):
+        env_file = Path('.env')
+        if env_file.exists():
+            from dotenv import load_dotenv
+            load_dotenv()
+            print("Loaded environment variables from .env")
+        os.environ[ENV_LOADED_FLAG] = '1'
 
     # Create worker manager
     manager = WorkerManager(
@@ -260,7 +300,25 @@ Examples:
         log_level=args.log_level
     )
 
-    # Handle different modes
+    try:
+        return run(manager, args)
+    except ImportError as e:
+        print(f"Error: Missing required dependencies: {e}")
+        print("Please install requirements: pip install -r requirements.txt")
+        return 1
+
+
+def run(manager: WorkerManager, args: argparse.Namespace) -> int:
+    """
+    Run the mode selected on the command line.
+
+    Args:
+        manager: Configured worker manager
+        args: Parsed command line arguments
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
     if args.info:
         info = manager.get_worker_info()
         if 'error' in info:
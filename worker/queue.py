@@ -5,29 +5,142 @@
 Async job queue system for background processing of consent analysis tasks.
 """
 
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Callable
 import uuid
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Callable, Sequence
 
 import redis
+from redis.utils import HIREDIS_AVAILABLE
 from rq import Queue, Worker
-from rq.job import Job
+from rq.job import Job, JobStatus
 from rq.exceptions import NoSuchJobError
+from rq.results import Result
+from rq.utils import as_text
+from sqlalchemy import delete, insert, select, update
 
-from micro_consent_pipeline.config.settings import Settings
+from micro_consent_pipeline.config.settings import get_settings
 from db.session import get_db_sync
-from db.models import JobRecord
+from db.models import JobRecord, generate_job_id
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Initialize settings and Redis connection
-settings = Settings()
-redis_conn = redis.from_url(settings.redis_url)
+settings = get_settings()
+# Callers wait for a free pooled connection instead of opening unbounded sockets
+redis_pool = redis.BlockingConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=settings.redis_max_connections,
+    timeout=20,
+    socket_keepalive=True,
+    health_check_interval=30
+)
+redis_conn = redis.Redis(connection_pool=redis_pool)
 logger = logging.getLogger(__name__)
 
+if not HIREDIS_AVAILABLE:
+    # redis-py uses hiredis automatically when installed; without it replies
+    # are parsed in pure Python, which dominates bulk status reads
+    logger.warning("hiredis is not installed; install redis[hiredis] for faster Redis reply parsing")
+
+# Job records deleted per transaction by cleanup_old_jobs
+CLEANUP_BATCH_SIZE = 1000
+
+_JOB_KEY_PREFIX = Job.redis_job_namespace_prefix.encode()
+
+# Pub/Sub channel announcing jobs that finished or failed
+JOB_EVENTS_CHANNEL = 'jobs:events'
+
+
+def _job_key(job_id: str) -> bytes:
+    """Build a job's Redis hash key as bytes, which redis-py sends without encoding."""
+    return _JOB_KEY_PREFIX + job_id.encode()
+
+
+class JobSerializer:
+    """
+    RQ serializer storing job arguments, results and metadata as JSON.
+
+    Replaces RQ's default pickle, which is slower and unsafe to load from a shared
+    Redis. Only JSON types are accepted: anything else raises TypeError when the
+    job is enqueued instead of reaching the worker as a different type. As in
+    any JSON, tuples come back as lists and non-string dict keys as strings.
+    Every payload starts with a format byte; payloads larger than
+    COMPRESS_THRESHOLD bytes are zlib-compressed. Payloads are decoded with
+    orjson when it is installed, since status reads decode far more often than
+    jobs are written.
+    """
+
+    COMPRESS_THRESHOLD = 1024
+
+    # Leading format byte of every payload
+    FORMAT_JSON = b'\x00'
+    FORMAT_JSON_ZLIB = b'\x01'
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize an object for storage in Redis.
+
+        Args:
+            obj: JSON-compatible object
+
+        Returns:
+            bytes: Format byte followed by JSON, compressed if large
+
+        Raises:
+            TypeError: If obj contains a value JSON cannot represent
+        """
+        # The standard encoder raises TypeError for every non-JSON type, where
+        # orjson would silently write datetimes, UUIDs and dataclasses as strings
+        data = json.dumps(obj, separators=(',', ':'), ensure_ascii=False, allow_nan=False).encode()
+        if len(data) > JobSerializer.COMPRESS_THRESHOLD:
+            return JobSerializer.FORMAT_JSON_ZLIB + zlib.compress(data, 1)
+        return JobSerializer.FORMAT_JSON + data
+
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        """
+        Deserialize data written by dumps.
+
+        Args:
+            data: Stored bytes
+
+        Returns:
+            Any: Deserialized object
+
+        Raises:
+            ValueError: If data does not start with a known format byte
+        """
+        marker, payload = data[:1], data[1:]
+        if marker == JobSerializer.FORMAT_JSON_ZLIB:
+            payload = zlib.decompress(payload)
+        elif marker != JobSerializer.FORMAT_JSON:
+            raise ValueError(f"Unknown job payload format {marker!r}")
+        return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
 # Create RQ queues
-default_queue = Queue('default', connection=redis_conn)
-high_priority_queue = Queue('high', connection=redis_conn)
-low_priority_queue = Queue('low', connection=redis_conn)
+default_queue = Queue('default', connection=redis_conn, serializer=JobSerializer)
+high_priority_queue = Queue('high', connection=redis_conn, serializer=JobSerializer)
+low_priority_queue = Queue('low', connection=redis_conn, serializer=JobSerializer)
+
+# Priority name to queue; unknown priorities fall back to the default queue
+_QUEUES = {
+    'high': high_priority_queue,
+    'default': default_queue,
+    'low': low_priority_queue,
+}
+
+
+def close_pool() -> None:
+    """Close all pooled Redis connections, e.g. on shutdown."""
+    redis_pool.disconnect()
 
 
 def enqueue_task(func: Callable, *args, priority: str = 'default',
@@ -44,14 +157,14 @@ def enqueue_task(func: Callable, *args, priority: str = 'default',
         priority: Queue priority ('high', 'default', 'low')
         job_timeout: Job timeout in seconds (default from settings)
         result_ttl: Result time-to-live in seconds (default from settings)
-        job_id: Custom job ID (default: generate UUID)
+        job_id: Custom job ID (default: generate a time-ordered UUID)
         **kwargs: Keyword arguments for the function
 
     Returns:
         str: Job ID
     """
     if job_id is None:
-        job_id = str(uuid.uuid4())
+        job_id = generate_job_id()
 
     if job_timeout is None:
         job_timeout = settings.job_timeout
@@ -59,28 +172,105 @@ def enqueue_task(func: Callable, *args, priority: str = 'default',
     if result_ttl is None:
         result_ttl = settings.result_ttl
 
-    # Select queue based on priority
-    if priority == 'high':
-        queue = high_priority_queue
-    elif priority == 'low':
-        queue = low_priority_queue
-    else:
-        queue = default_queue
-
-    # Enqueue the job
-    job = queue.enqueue(
-        func,
-        *args,
-        job_id=job_id,
-        job_timeout=job_timeout,
-        result_ttl=result_ttl,
-        **kwargs
-    )
-
-    logger.info(f"Enqueued job {job_id} with priority {priority}")
+    # Enqueue the job; with our own pipeline RQ's queue registration and job
+    # writes go to Redis in one round-trip instead of two
+    with redis_conn.pipeline() as pipe:
+        job = _QUEUES.get(priority, default_queue).enqueue(
+            func,
+            *args,
+            job_id=job_id,
+            job_timeout=job_timeout,
+            result_ttl=result_ttl,
+            pipeline=pipe,
+            **kwargs
+        )
+        pipe.execute()
+
+    logger.info("Enqueued job %s with priority %s", job_id, priority)
     return job_id
 
 
+def enqueue_tasks_bulk(func: Callable, args_list: Iterable[Sequence[Any]],
+                       priority: str = 'default',
+                       job_timeout: Optional[int] = None,
+                       result_ttl: Optional[int] = None,
+                       job_ids: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Enqueue one job per argument tuple in a single Redis round-trip.
+
+    Args:
+        func: Function to execute
+        args_list: Positional arguments for each job
+        priority: Queue priority ('high', 'default', 'low')
+        job_timeout: Job timeout in seconds (default from settings)
+        result_ttl: Result time-to-live in seconds (default from settings)
+        job_ids: Custom job IDs, one per job (default: generate time-ordered UUIDs)
+
+    Returns:
+        List[str]: Job IDs in the order of args_list
+    """
+    if job_timeout is None:
+        job_timeout = settings.job_timeout
+
+    if result_ttl is None:
+        result_ttl = settings.result_ttl
+
+    args_list = list(args_list)
+    if job_ids is None:
+        job_ids = [generate_job_id() for _ in args_list]
+    elif len(job_ids) != len(args_list):
+        raise ValueError("job_ids must have one entry per job")
+
+    job_datas = [
+        Queue.prepare_data(func, args=tuple(args), job_id=job_id,
+                           timeout=job_timeout, result_ttl=result_ttl)
+        for args, job_id in zip(args_list, job_ids)
+    ]
+    # enqueue_many writes every job through one pipeline
+    jobs = _QUEUES.get(priority, default_queue).enqueue_many(job_datas)
+
+    logger.info("Enqueued %d jobs with priority %s", len(jobs), priority)
+    return [job.id for job in jobs]
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional timestamp as ISO 8601."""
+    return value.isoformat() if value else None
+
+
+def _status_info(job_id: str, job: Job, status: JobStatus, result: Optional[Result]) -> Dict[str, Any]:
+    """
+    Build the status dictionary returned for a job.
+
+    Args:
+        job_id: Job ID as requested
+        job: Fetched job
+        status: Job status
+        result: Latest result of a finished or failed job, if any
+
+    Returns:
+        Dict containing job status information
+    """
+    status_info = {
+        'job_id': job_id,
+        'status': status,
+        'created_at': _isoformat(job.created_at),
+        'started_at': _isoformat(job.started_at),
+        'ended_at': _isoformat(job.ended_at),
+        'result': None,
+        'error': None,
+        'progress': job.meta.get('progress') if job.meta else None
+    }
+
+    if status == JobStatus.FINISHED:
+        if result and result.type == Result.Type.SUCCESSFUL:
+            status_info['result'] = result.return_value
+    elif status == JobStatus.FAILED:
+        status_info['error'] = result.exc_string if result and result.exc_string else 'Unknown error'
+
+    return status_info
+
+
 def get_job_status(job_id: str) -> Dict[str, Any]:
     """
     Get the status and result of a job.
@@ -92,29 +282,12 @@ def get_job_status(job_id: str) -> Dict[str, Any]:
         Dict containing job status information
     """
     try:
-        job = Job.fetch(job_id, connection=redis_conn)
-
-        status_info = {
-            'job_id': job_id,
-            'status': job.get_status(),
-            'created_at': job.created_at.isoformat() if job.created_at else None,
-            'started_at': job.started_at.isoformat() if job.started_at else None,
-            'ended_at': job.ended_at.isoformat() if job.ended_at else None,
-            'result': None,
-            'error': None,
-            'progress': None
-        }
+        job = Job.fetch(job_id, connection=redis_conn, serializer=JobSerializer)
 
-        if job.is_finished:
-            status_info['result'] = job.result
-        elif job.is_failed:
-            status_info['error'] = str(job.exc_info) if job.exc_info else 'Unknown error'
-
-        # Get progress if available
-        if hasattr(job, 'meta') and job.meta:
-            status_info['progress'] = job.meta.get('progress')
-
-        return status_info
+        # The fetched hash already holds the status; read it once without a refresh
+        status = job.get_status(refresh=False)
+        result = job.latest_result() if status in (JobStatus.FINISHED, JobStatus.FAILED) else None
+        return _status_info(job_id, job, status, result)
 
     except NoSuchJobError:
         return {
@@ -123,7 +296,7 @@ def get_job_status(job_id: str) -> Dict[str, Any]:
             'error': 'Job not found'
         }
     except Exception as e:
-        logger.error(f"Error getting job status for {job_id}: {e}")
+        logger.error("Error getting job status for %s: %s", job_id, e)
         return {
             'job_id': job_id,
             'status': 'error',
@@ -131,6 +304,57 @@ def get_job_status(job_id: str) -> Dict[str, Any]:
         }
 
 
+def get_jobs_status(job_ids: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Get the status and result of several jobs.
+
+    Job hashes are fetched in one pipelined round-trip and the latest results of
+    finished or failed jobs in a second one, instead of several calls per job.
+
+    Args:
+        job_ids: Job IDs to check
+
+    Returns:
+        List[Dict[str, Any]]: Status information for each job, in the order given
+    """
+    try:
+        jobs = Job.fetch_many(job_ids, connection=redis_conn, serializer=JobSerializer)
+        done = [
+            job for job in jobs
+            if job and job.get_status(refresh=False) in (JobStatus.FINISHED, JobStatus.FAILED)
+        ]
+        latest: Dict[str, Result] = {}
+        if done:
+            with redis_conn.pipeline(transaction=False) as pipe:
+                for job in done:
+                    pipe.xrevrange(Result.get_key(job.id), '+', '-', count=1)
+                responses = pipe.execute()
+            for job, response in zip(done, responses):
+                if response:
+                    result_id, payload = response[0]
+                    latest[job.id] = Result.restore(
+                        job.id, as_text(result_id), payload,
+                        connection=redis_conn, serializer=JobSerializer
+                    )
+    except Exception as e:
+        logger.error("Error getting job status for %d jobs: %s", len(job_ids), e)
+        return [{'job_id': job_id, 'status': 'error', 'error': str(e)} for job_id in job_ids]
+
+    statuses = []
+    for job_id, job in zip(job_ids, jobs):
+        if job is None:
+            statuses.append({
+                'job_id': job_id,
+                'status': 'not_found',
+                'error': 'Job not found'
+            })
+            continue
+
+        statuses.append(_status_info(job_id, job, job.get_status(refresh=False), latest.get(job.id)))
+
+    return statuses
+
+
 def cancel_job(job_id: str) -> bool:
     """
     Cancel a queued or running job.
@@ -142,15 +366,15 @@ def cancel_job(job_id: str) -> bool:
         bool: True if job was cancelled successfully
     """
     try:
-        job = Job.fetch(job_id, connection=redis_conn)
+        job = Job.fetch(job_id, connection=redis_conn, serializer=JobSerializer)
         job.cancel()
-        logger.info(f"Cancelled job {job_id}")
+        logger.info("Cancelled job %s", job_id)
         return True
     except NoSuchJobError:
-        logger.warning(f"Job {job_id} not found for cancellation")
+        logger.warning("Job %s not found for cancellation", job_id)
         return False
     except Exception as e:
-        logger.error(f"Error cancelling job {job_id}: {e}")
+        logger.error("Error cancelling job %s: %s", job_id, e)
         return False
 
 
@@ -158,31 +382,35 @@ def get_queue_info() -> Dict[str, Any]:
     """
     Get information about all queues.
 
+    All counts are read in one pipelined round-trip. Registries are counted
+    without RQ's cleanup pass, which workers already run periodically.
+
     Returns:
         Dict containing queue statistics
     """
+    queues = {
+        'high_priority': high_priority_queue,
+        'default': default_queue,
+        'low_priority': low_priority_queue,
+    }
+
+    with redis_conn.pipeline(transaction=False) as pipe:
+        for queue in queues.values():
+            pipe.llen(queue.key)
+            pipe.zcard(queue.failed_job_registry.key)
+            pipe.zcard(queue.started_job_registry.key)
+            pipe.zcard(queue.finished_job_registry.key)
+        counts = iter(pipe.execute())
+
     return {
-        'high_priority': {
-            'name': 'high',
-            'length': len(high_priority_queue),
-            'failed_count': high_priority_queue.failed_job_registry.count,
-            'started_count': high_priority_queue.started_job_registry.count,
-            'finished_count': high_priority_queue.finished_job_registry.count,
-        },
-        'default': {
-            'name': 'default',
-            'length': len(default_queue),
-            'failed_count': default_queue.failed_job_registry.count,
-            'started_count': default_queue.started_job_registry.count,
-            'finished_count': default_queue.finished_job_registry.count,
-        },
-        'low_priority': {
-            'name': 'low',
-            'length': len(low_priority_queue),
-            'failed_count': low_priority_queue.failed_job_registry.count,
-            'started_count': low_priority_queue.started_job_registry.count,
-            'finished_count': low_priority_queue.finished_job_registry.count,
+        label: {
+            'name': queue.name,
+            'length': next(counts),
+            'failed_count': next(counts),
+            'started_count': next(counts),
+            'finished_count': next(counts),
         }
+        for label, queue in queues.items()
     }
 
 
@@ -213,9 +441,44 @@ def create_job_record(job_id: str, source_url: str, output_format: str = 'json',
         )
         db.add(job_record)
         db.commit()
-        logger.info(f"Created job record for {job_id}")
+        logger.info("Created job record for %s", job_id)
+    except Exception as e:
+        logger.error("Error creating job record for %s: %s", job_id, e)
+        db.rollback()
+    finally:
+        db.close()
+
+
+def create_job_records_bulk(records: Iterable[Dict[str, Any]]) -> None:
+    """
+    Create database records for several jobs in one transaction.
+
+    Args:
+        records: Keyword arguments for each record, as accepted by create_job_record
+    """
+    rows = [
+        {
+            'id': record['job_id'],
+            'source_url': record['source_url'],
+            'status': 'queued',
+            'output_format': record.get('output_format', 'json'),
+            'priority': record.get('priority', 0),
+            'user_agent': record.get('user_agent'),
+            'ip_address': record.get('ip_address')
+        }
+        for record in records
+    ]
+    if not rows:
+        return
+
+    db = get_db_sync()
+    try:
+        # A Core executemany is sent as multi-row INSERTs, skipping ORM object setup
+        db.execute(insert(JobRecord), rows)
+        db.commit()
+        logger.info("Created %d job records", len(rows))
     except Exception as e:
-        logger.error(f"Error creating job record for {job_id}: {e}")
+        logger.error("Error creating job records: %s", e)
         db.rollback()
     finally:
         db.close()
@@ -236,65 +499,144 @@ def update_job_record(job_id: str, status: Optional[str] = None,
         error_message: Error message if job failed
     """
     db = get_db_sync()
+    updated = False
     try:
-        job_record = db.query(JobRecord).filter(JobRecord.id == job_id).first()
-        if job_record:
-            if status:
-                job_record.status = status
-                if status == 'started':
-                    job_record.started_at = datetime.utcnow()
-                elif status in ['finished', 'failed']:
-                    job_record.finished_at = datetime.utcnow()
-
-            if consent_record_id:
-                job_record.consent_record_id = consent_record_id
-            if result_data:
-                job_record.result_data = result_data
-            if error_message:
-                job_record.error_message = error_message
-
-            db.commit()
-            logger.info(f"Updated job record for {job_id}")
+        values: Dict[str, Any] = {}
+        if status:
+            values['status'] = status
+            if status == 'started':
+                values['started_at'] = datetime.now(timezone.utc)
+            elif status in ['finished', 'failed']:
+                values['finished_at'] = datetime.now(timezone.utc)
+
+        if consent_record_id:
+            # Callers pass the ID as a string; the column stores UUID objects
+            values['consent_record_id'] = uuid.UUID(str(consent_record_id))
+        if result_data:
+            values['result_data'] = result_data
+        if error_message:
+            values['error_message'] = error_message
+
+        if not values:
+            return
+
+        # One UPDATE instead of loading the record first
+        result = db.execute(
+            update(JobRecord).where(JobRecord.id == job_id).values(**values),
+            execution_options={'synchronize_session': False}
+        )
+        db.commit()
+        updated = result.rowcount > 0
+        if updated:
+            logger.info("Updated job record for %s", job_id)
         else:
-            logger.warning(f"Job record not found for {job_id}")
+            logger.warning("Job record not found for %s", job_id)
     except Exception as e:
-        logger.error(f"Error updating job record for {job_id}: {e}")
+        logger.error("Error updating job record for %s: %s", job_id, e)
         db.rollback()
     finally:
         db.close()
 
+    # Announce completion only once it is committed
+    if updated and status in ['finished', 'failed']:
+        publish_status(job_id, status, {'error': error_message} if error_message else None)
+
+
+def publish_status(job_id: str, status: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Announce a job status change on JOB_EVENTS_CHANNEL.
+
+    Subscribers can wait for completion instead of polling get_job_status, which
+    remains the way to read the result and to catch up on missed events.
+    Messages are encoded with JobSerializer.dumps.
+
+    Args:
+        job_id: Job ID
+        status: New job status
+        extra: Additional event details
+    """
+    try:
+        redis_conn.publish(JOB_EVENTS_CHANNEL, JobSerializer.dumps({'id': job_id, 'status': status, 'extra': extra}))
+    except Exception as e:
+        logger.warning("Error publishing status for %s: %s", job_id, e)
+
 
-def cleanup_old_jobs(days: int = 7) -> int:
+def cleanup_old_jobs(days: int = 7, batch_size: int = CLEANUP_BATCH_SIZE) -> int:
     """
     Clean up old job records and Redis job data.
 
+    Records are deleted in batches, each committed separately so no single
+    DELETE holds table locks for long, and the matching Redis jobs are
+    deleted with one pipelined round-trip per batch.
+
     Args:
         days: Number of days to keep job records
+        batch_size: Number of records deleted per transaction
 
     Returns:
         int: Number of records cleaned up
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
     db = get_db_sync()
+    deleted_count = 0
 
     try:
-        # Clean up database records
-        deleted_count = db.query(JobRecord).filter(
-            JobRecord.created_at < cutoff_date
-        ).delete()
+        while True:
+            job_ids = db.scalars(
+                select(JobRecord.id)
+                .where(JobRecord.created_at < cutoff_date)
+                .order_by(JobRecord.created_at, JobRecord.id)
+                .limit(batch_size)
+            ).all()
+            if not job_ids:
+                break
+
+            db.execute(
+                delete(JobRecord).where(JobRecord.id.in_(job_ids)),
+                execution_options={'synchronize_session': False}
+            )
+            db.commit()
+            deleted_count += len(job_ids)
+            _delete_redis_jobs(job_ids)
 
-        db.commit()
-        logger.info(f"Cleaned up {deleted_count} old job records")
+        logger.info("Cleaned up %d old job records", deleted_count)
         return deleted_count
 
     except Exception as e:
-        logger.error(f"Error cleaning up old jobs: {e}")
+        logger.error("Error cleaning up old jobs: %s", e)
         db.rollback()
-        return 0
+        return deleted_count
     finally:
         db.close()
 
 
+def _delete_redis_jobs(job_ids: Sequence[str]) -> None:
+    """
+    Delete the Redis data for a batch of jobs in one round-trip.
+
+    Besides the job hashes, this removes the IDs from every queue's job
+    registries and deletes their result streams and dependents sets. Finished
+    job hashes have usually expired by now, but their IDs can stay in the
+    failed registry for a year and would keep being counted by get_queue_info.
+
+    Args:
+        job_ids: IDs of the jobs to delete
+    """
+    try:
+        with redis_conn.pipeline(transaction=False) as pipe:
+            for queue in _QUEUES.values():
+                for registry in (queue.finished_job_registry, queue.failed_job_registry,
+                                 queue.deferred_job_registry, queue.scheduled_job_registry,
+                                 queue.canceled_job_registry):
+                    pipe.zrem(registry.key, *job_ids)
+            for job_id in job_ids:
+                pipe.delete(_job_key(job_id), Job.dependents_key_for(job_id), Result.get_key(job_id))
+            pipe.execute()
+    except Exception as e:
+        # The database records are already gone; RQ expires leftovers eventually
+        logger.warning("Error deleting %d Redis jobs: %s", len(job_ids), e)
+
+
 def start_worker(queues: Optional[list] = None, name: Optional[str] = None) -> Worker:
     """
     Start an RQ worker process.
@@ -310,14 +652,9 @@ def start_worker(queues: Optional[list] = None, name: Optional[str] = None) -> W
         queues = [high_priority_queue, default_queue, low_priority_queue]
     else:
         # Convert queue names to queue objects
-        queue_map = {
-            'high': high_priority_queue,
-            'default': default_queue,
-            'low': low_priority_queue
-        }
-        queues = [queue_map.get(q, default_queue) for q in queues]
+        queues = [_QUEUES.get(q, default_queue) for q in queues]
 
-    worker = Worker(queues, connection=redis_conn, name=name)
-    logger.info(f"Starting worker {worker.name} with queues: {[q.name for q in queues]}")
+    worker = Worker(queues, connection=redis_conn, name=name, serializer=JobSerializer)
+    logger.info("Starting worker %s with queues: %s", worker.name, [q.name for q in queues])
 
     return worker
\ No newline at end of file